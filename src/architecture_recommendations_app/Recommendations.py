@@ -1,5 +1,6 @@
 """Customer-facing Azure Architecture Recommendations Application."""
 
+import hashlib
 import json
 import os
 import subprocess
@@ -187,10 +188,10 @@ def _get_samples_directory() -> Path | None:
     # Log what we're looking for (for debugging)
     import logging
     logger = logging.getLogger(__name__)
-    logger.debug(f"Could not find samples directory")
-    logger.debug(f"  __file__: {__file__}")
-    logger.debug(f"  cwd: {Path.cwd()}")
-    logger.debug(f"  sys.path: {sys.path[:3]}")
+    logger.debug("Could not find samples directory")
+    logger.debug("  __file__: %s", __file__)
+    logger.debug("  cwd: %s", Path.cwd())
+    logger.debug("  sys.path: %s", sys.path[:3])
 
     return None
 
@@ -902,7 +903,9 @@ def _render_step1_upload(catalog_path: str) -> None:
 
     if uploaded_file is not None:
         try:
-            file_hash = hash(uploaded_file.getvalue())
+            # Hash the upload through a buffer view rather than a getvalue() copy
+            with uploaded_file.getbuffer() as buf:
+                file_hash = hashlib.blake2b(buf, digest_size=16).digest()
 
             # Check if this is a new file
             if get_state('last_file_hash') != file_hash:
@@ -1,8 +1,15 @@
 """PDF report generator using reportlab with professional styling."""
 
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from datetime import datetime
-from typing import Callable
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import BinaryIO, Callable
 
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,12 +20,35 @@ from reportlab.platypus import (
     Image, PageBreak, KeepTogether, Flowable, HRFlowable
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.graphics.shapes import Drawing, Rect, String, Line
 from reportlab.graphics.widgets.markers import makeMarker
 
 from architecture_scorer.schema import ScoringResult, ArchitectureRecommendation, ClarificationQuestion
 from architecture_recommendations_app.utils.sanitize import validate_url
 
+# Diagram embedding is optional: reports are still generated without these
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # OSError: native cairo library missing
+    cairosvg = None
+
 
 # Azure brand colors
 AZURE_BLUE = HexColor('#0078D4')
@@ -34,6 +64,121 @@ LIGHT_GRAY = HexColor('#F5F5F5')
 MEDIUM_GRAY = HexColor('#E1E1E1')
 DARK_GRAY = HexColor('#333333')
 TEXT_GRAY = HexColor('#605E5C')
+WARNING_ORANGE = HexColor('#B7791F')  # Darker yellow/orange for readability
+
+# Paragraph style names for the quality label, keyed by CatalogQuality value
+_QUALITY_STYLE_BY_VALUE = {
+    'curated': 'QualityCurated',
+    'ai_enriched': 'QualityEnriched',
+}
+_DEFAULT_QUALITY_STYLE = 'QualityOther'
+
+# Static table styles, built once at import and shared by every report
+_LOGO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), AZURE_BLUE),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), AZURE_BLUE_LIGHT),
+    ('BACKGROUND', (1, 0), (1, -1), white),
+    ('TEXTCOLOR', (0, 0), (0, -1), AZURE_BLUE_DARK),
+    ('TEXTCOLOR', (1, 0), (1, -1), DARK_GRAY),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 12),
+    ('BOX', (0, 0), (-1, -1), 1, AZURE_BLUE),
+    ('LINEAFTER', (0, 0), (0, -1), 1, AZURE_BLUE),
+])
+_CONF_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+])
+_TWO_COLUMN_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+])
+_ANSWER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), LIGHT_GRAY),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, -1), DARK_GRAY),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, MEDIUM_GRAY),
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [white, LIGHT_GRAY]),
+])
+_FIT_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+])
+
+
+def _header_table_style(rank_color: Color) -> TableStyle:
+    """Build the recommendation header table style for a rank badge colour."""
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BACKGROUND', (0, 0), (0, 0), rank_color),
+        ('TEXTCOLOR', (0, 0), (0, 0), white),
+        ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+        ('LEFTPADDING', (1, 0), (1, 0), 10),
+    ])
+
+
+# Recommendation header styles by rank: #1, #2-#3, and the rest
+_HEADER_TABLE_STYLE_FIRST = _header_table_style(AZURE_BLUE)
+_HEADER_TABLE_STYLE_TOP3 = _header_table_style(AZURE_GREEN)
+_HEADER_TABLE_STYLE_OTHER = _header_table_style(TEXT_GRAY)
+
+# Pattern/quality line: pattern text and quality label side by side, with a
+# space-wide gap before the label and both aligned on their last line
+_PATTERN_LINE_WIDTH = 6.5 * inch
+_PATTERN_LABEL_GAP = 3
+_PATTERN_LINE_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'BOTTOM'),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('LEFTPADDING', (0, 0), (0, 0), 0),
+    ('LEFTPADDING', (1, 0), (1, 0), _PATTERN_LABEL_GAP),
+])
+
+# Upper bound on concurrent diagram downloads per report
+MAX_DIAGRAM_FETCH_WORKERS = 8
+
+# Diagrams larger than this are discarded (bounds memory per download)
+MAX_DIAGRAM_BYTES = 5 * 1024 * 1024
+
+# On-disk cache of downloaded diagrams, shared across reports (LRU by mtime)
+DIAGRAM_CACHE_DIR = Path(tempfile.gettempdir()) / "azarch_diagrams"
+DIAGRAM_CACHE_MAX_FILES = 256
+
+# Pixel bounds for embedded raster diagrams (drawn at 5in x 2.5in, ~216 dpi)
+DIAGRAM_MAX_PIXELS = (1080, 540)
+
+# Raster width for SVG diagrams when cairosvg is available (5in at 144 dpi)
+DIAGRAM_SVG_RASTER_WIDTH = 720
+
+# One HTTP session per thread: requests.Session isn't documented as
+# thread-safe, and reports are built from fetch workers and concurrent
+# Streamlit sessions at once
+_HTTP_LOCAL = threading.local()
+
+
+def _http_session() -> "requests.Session":
+    """Return this thread's HTTP session, creating it on first use."""
+    session = getattr(_HTTP_LOCAL, 'session', None)
+    if session is None:
+        session = _HTTP_LOCAL.session = requests.Session()
+    return session
 
 
 class ScoreBar(Flowable):
@@ -48,11 +193,7 @@ class ScoreBar(Flowable):
         self.height = height
 
     def draw(self):
-        # Background bar
-        self.canv.setFillColor(MEDIUM_GRAY)
-        self.canv.roundRect(0, 0, self.bar_width, self.bar_height, 3, fill=1, stroke=0)
-
-        # Score bar with gradient color based on score
+        # Resolve all drawing parameters before touching the canvas
         if self.score >= 80:
             fill_color = AZURE_GREEN
         elif self.score >= 60:
@@ -61,18 +202,27 @@ class ScoreBar(Flowable):
             fill_color = AZURE_YELLOW
         else:
             fill_color = AZURE_RED
-
         fill_width = (self.score / 100) * self.bar_width
+        text_color = white if self.score > 50 else DARK_GRAY
+
+        canv = self.canv
+        canv.saveState()
+
+        # Background bar
+        canv.setFillColor(MEDIUM_GRAY)
+        canv.roundRect(0, 0, self.bar_width, self.bar_height, 3, fill=1, stroke=0)
+
+        # Score bar with color based on score
         if fill_width > 0:
-            self.canv.setFillColor(fill_color)
-            self.canv.roundRect(0, 0, fill_width, self.bar_height, 3, fill=1, stroke=0)
+            canv.setFillColor(fill_color)
+            canv.roundRect(0, 0, fill_width, self.bar_height, 3, fill=1, stroke=0)
 
         # Score text
-        self.canv.setFillColor(white if self.score > 50 else DARK_GRAY)
-        self.canv.setFont('Helvetica-Bold', 10)
-        text_x = self.bar_width / 2
-        text_y = self.bar_height / 2 - 3
-        self.canv.drawCentredString(text_x, text_y, f"{self.score:.0f}%")
+        canv.setFillColor(text_color)
+        canv.setFont('Helvetica-Bold', 10)
+        canv.drawCentredString(self.bar_width / 2, self.bar_height / 2 - 3, f"{self.score:.0f}%")
+
+        canv.restoreState()
 
 
 class ConfidenceBadge(Flowable):
@@ -93,21 +243,23 @@ class ConfidenceBadge(Flowable):
         self.height = height
 
     def draw(self):
-        colors = self.COLORS.get(self.level, self.COLORS['medium'])
-        border_color, fill_color, label = colors
+        border_color, fill_color, label = self.COLORS.get(self.level, self.COLORS['medium'])
+
+        canv = self.canv
+        canv.saveState()
 
         # Badge background
-        self.canv.setFillColor(fill_color)
-        self.canv.setStrokeColor(border_color)
-        self.canv.setLineWidth(1.5)
-        self.canv.roundRect(0, 0, self.badge_width, self.badge_height, 4, fill=1, stroke=1)
+        canv.setFillColor(fill_color)
+        canv.setStrokeColor(border_color)
+        canv.setLineWidth(1.5)
+        canv.roundRect(0, 0, self.badge_width, self.badge_height, 4, fill=1, stroke=1)
 
         # Badge text
-        self.canv.setFillColor(border_color)
-        self.canv.setFont('Helvetica-Bold', 9)
-        text_x = self.badge_width / 2
-        text_y = self.badge_height / 2 - 3
-        self.canv.drawCentredString(text_x, text_y, label.upper())
+        canv.setFillColor(border_color)
+        canv.setFont('Helvetica-Bold', 9)
+        canv.drawCentredString(self.badge_width / 2, self.badge_height / 2 - 3, label.upper())
+
+        canv.restoreState()
 
 
 class SectionDivider(Flowable):
@@ -121,79 +273,31 @@ class SectionDivider(Flowable):
         self.height = 0.15*inch
 
     def draw(self):
+        y = 0.075*inch
+        split_x = self.line_width * 0.3
+
+        canv = self.canv
+        canv.saveState()
+
         # Main line
-        self.canv.setStrokeColor(self.line_color)
-        self.canv.setLineWidth(2)
-        self.canv.line(0, 0.075*inch, self.line_width * 0.3, 0.075*inch)
+        canv.setStrokeColor(self.line_color)
+        canv.setLineWidth(2)
+        canv.line(0, y, split_x, y)
 
         # Faded extension
-        self.canv.setStrokeColor(MEDIUM_GRAY)
-        self.canv.setLineWidth(1)
-        self.canv.line(self.line_width * 0.3, 0.075*inch, self.line_width, 0.075*inch)
+        canv.setStrokeColor(MEDIUM_GRAY)
+        canv.setLineWidth(1)
+        canv.line(split_x, y, self.line_width, y)
 
+        canv.restoreState()
 
-class RecommendationCard(Flowable):
-    """A framed card for displaying a recommendation."""
 
-    def __init__(self, content_flowables: list, score: float, rank: int,
-                 width: float = 6.5*inch, padding: float = 0.15*inch):
-        super().__init__()
-        self.content = content_flowables
-        self.score = score
-        self.rank = rank
-        self.card_width = width
-        self.padding = padding
-
-        # Calculate height based on content
-        self.card_height = self._calculate_height()
-        self.width = width
-        self.height = self.card_height
-
-    def _calculate_height(self) -> float:
-        # Estimate height based on content
-        total = self.padding * 2 + 0.4*inch  # Top bar + padding
-        for item in self.content:
-            if hasattr(item, 'wrap'):
-                w, h = item.wrap(self.card_width - self.padding * 2 - 0.3*inch, 1000)
-                total += h
-            elif hasattr(item, 'height'):
-                total += item.height
-            else:
-                total += 0.2*inch
-        return total
+def _header_footer(canvas, doc, header_date: str):
+    """Add header and footer to each page.
 
-    def draw(self):
-        # Rank indicator color
-        if self.rank == 1:
-            accent_color = AZURE_GREEN
-        elif self.rank <= 3:
-            accent_color = AZURE_BLUE
-        else:
-            accent_color = TEXT_GRAY
-
-        # Card background
-        self.canv.setFillColor(white)
-        self.canv.setStrokeColor(MEDIUM_GRAY)
-        self.canv.setLineWidth(1)
-        self.canv.roundRect(0, 0, self.card_width, self.card_height, 6, fill=1, stroke=1)
-
-        # Left accent bar
-        self.canv.setFillColor(accent_color)
-        self.canv.roundRect(0, 0, 0.15*inch, self.card_height, 6, fill=1, stroke=0)
-        # Cover the right rounded corners of accent
-        self.canv.rect(0.1*inch, 0, 0.05*inch, self.card_height, fill=1, stroke=0)
-
-        # Rank badge in top-left
-        self.canv.setFillColor(accent_color)
-        badge_size = 0.35*inch
-        self.canv.circle(0.3*inch, self.card_height - 0.3*inch, badge_size/2, fill=1, stroke=0)
-        self.canv.setFillColor(white)
-        self.canv.setFont('Helvetica-Bold', 12)
-        self.canv.drawCentredString(0.3*inch, self.card_height - 0.34*inch, f"#{self.rank}")
-
-
-def _header_footer(canvas, doc):
-    """Add header and footer to each page."""
+    The date string is computed once per report by the caller rather than
+    on every page render.
+    """
     canvas.saveState()
 
     # Header
@@ -208,7 +312,7 @@ def _header_footer(canvas, doc):
     canvas.drawRightString(
         doc.pagesize[0] - 0.75*inch,
         doc.pagesize[1] - 0.32*inch,
-        datetime.now().strftime('%Y-%m-%d')
+        header_date
     )
 
     # Footer
@@ -251,26 +355,30 @@ def _first_page_header_footer(canvas, doc):
 def generate_pdf_report(
     result: ScoringResult,
     questions: list[ClarificationQuestion] | None = None,
-    user_answers: dict[str, str] | None = None
-) -> bytes:
+    user_answers: dict[str, str] | None = None,
+    out: BinaryIO | None = None
+) -> bytes | None:
     """Generate a professionally styled PDF report from scoring results.
 
     Args:
         result: The ScoringResult to format as PDF
         questions: Optional list of clarification questions
         user_answers: Optional dictionary of user's answers (question_id -> value)
+        out: Optional writable binary stream. When given, the PDF is written
+            directly to it instead of being buffered in memory.
 
     Returns:
-        PDF file as bytes
+        PDF file as bytes, or None if the PDF was written to ``out``
     """
-    buffer = BytesIO()
+    buffer = out if out is not None else BytesIO()
     doc = SimpleDocTemplate(
         buffer,
         pagesize=letter,
         rightMargin=0.75 * inch,
         leftMargin=0.75 * inch,
         topMargin=0.75 * inch,
-        bottomMargin=0.6 * inch
+        bottomMargin=0.6 * inch,
+        pageCompression=1
     )
 
     # Build story (list of flowables)
@@ -289,21 +397,25 @@ def generate_pdf_report(
         story.extend(_build_answers_section(questions, user_answers, styles))
 
     # === RECOMMENDATIONS ===
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("Detailed Recommendations", styles['SectionTitle']))
+    story.append(Paragraph("Detailed Recommendations", styles['SpacedSectionTitle']))
     story.append(SectionDivider())
     story.append(Spacer(1, 0.2 * inch))
 
-    for i, rec in enumerate(result.recommendations, 1):
-        story.extend(_build_recommendation_section(rec, i, styles))
+    diagrams = _build_diagram_flowables(
+        result.recommendations, _fetch_diagrams(result.recommendations)
+    )
+    for i, (rec, diagram) in enumerate(zip(result.recommendations, diagrams), 1):
+        story.extend(_build_recommendation_section(rec, i, styles, diagram))
 
     # Build PDF with header/footer
+    header_date = datetime.now().strftime('%Y-%m-%d')
     doc.build(
         story,
         onFirstPage=_first_page_header_footer,
-        onLaterPages=_header_footer
+        onLaterPages=partial(_header_footer, header_date=header_date)
     )
-    buffer.seek(0)
+    if out is not None:
+        return None
     return buffer.getvalue()
 
 
@@ -319,11 +431,7 @@ def _build_cover_page(result: ScoringResult, styles) -> list:
         colWidths=[2*inch],
         rowHeights=[0.5*inch]
     )
-    logo_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), AZURE_BLUE),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    logo_table.setStyle(_LOGO_TABLE_STYLE)
     elements.append(logo_table)
 
     elements.append(Spacer(1, 0.5 * inch))
@@ -332,19 +440,15 @@ def _build_cover_page(result: ScoringResult, styles) -> list:
     elements.append(Paragraph("Architecture", styles['CoverTitle']))
     elements.append(Paragraph("Recommendations", styles['CoverTitle']))
 
-    elements.append(Spacer(1, 0.3 * inch))
-
     # Divider line
     elements.append(HRFlowable(
         width="40%",
         thickness=3,
         color=AZURE_BLUE,
-        spaceBefore=10,
-        spaceAfter=10
+        spaceBefore=0.3 * inch + 10,
+        spaceAfter=0.3 * inch + 10
     ))
 
-    elements.append(Spacer(1, 0.3 * inch))
-
     # Application name
     elements.append(Paragraph(
         f"<b>Application:</b> {result.application_name}",
@@ -363,21 +467,7 @@ def _build_cover_page(result: ScoringResult, styles) -> list:
     ]
 
     stats_table = Table(stats_data, colWidths=[2.5*inch, 3.5*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), AZURE_BLUE_LIGHT),
-        ('BACKGROUND', (1, 0), (1, -1), white),
-        ('TEXTCOLOR', (0, 0), (0, -1), AZURE_BLUE_DARK),
-        ('TEXTCOLOR', (1, 0), (1, -1), DARK_GRAY),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('PADDING', (0, 0), (-1, -1), 12),
-        ('BOX', (0, 0), (-1, -1), 1, AZURE_BLUE),
-        ('LINEAFTER', (0, 0), (0, -1), 1, AZURE_BLUE),
-    ]))
+    stats_table.setStyle(_STATS_TABLE_STYLE)
     elements.append(stats_table)
 
     elements.append(Spacer(1, 1 * inch))
@@ -411,10 +501,7 @@ def _build_executive_summary(result: ScoringResult, styles) -> list:
     ]]
 
     conf_table = Table(conf_table_data, colWidths=[1.2*inch, 1.3*inch, 0.3*inch, 1.1*inch, 2.5*inch])
-    conf_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    conf_table.setStyle(_CONF_TABLE_STYLE)
     elements.append(conf_table)
     elements.append(Spacer(1, 0.2 * inch))
 
@@ -443,11 +530,7 @@ def _build_executive_summary(result: ScoringResult, styles) -> list:
 
         two_col_data = [[left_content, right_content]]
         two_col_table = Table(two_col_data, colWidths=[3.25*inch, 3.25*inch])
-        two_col_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        two_col_table.setStyle(_TWO_COLUMN_TABLE_STYLE)
         elements.append(two_col_table)
 
     return elements
@@ -461,8 +544,7 @@ def _build_answers_section(
     """Build the user answers section."""
     elements = []
 
-    elements.append(Spacer(1, 0.3 * inch))
-    elements.append(Paragraph("Assessment Inputs", styles['SectionTitle']))
+    elements.append(Paragraph("Assessment Inputs", styles['SpacedSectionTitle']))
     elements.append(SectionDivider())
     elements.append(Spacer(1, 0.15 * inch))
 
@@ -480,26 +562,271 @@ def _build_answers_section(
 
     if answer_data:
         answer_table = Table(answer_data, colWidths=[3.5*inch, 3*inch])
-        answer_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), LIGHT_GRAY),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 0), (-1, -1), DARK_GRAY),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, MEDIUM_GRAY),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [white, LIGHT_GRAY]),
-        ]))
+        answer_table.setStyle(_ANSWER_TABLE_STYLE)
         elements.append(answer_table)
 
     return elements
 
 
-def _build_recommendation_section(rec: ArchitectureRecommendation, index: int, styles) -> list:
-    """Build a recommendation section with card styling."""
+def _diagram_cache_dir() -> Path | None:
+    """Return the diagram cache directory, or None if it is not safe to use.
+
+    The directory is created with owner-only permissions. If it already
+    exists but is owned by another user or is group/world accessible, the
+    cache is disabled rather than trusting its contents.
+    """
+    try:
+        DIAGRAM_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = DIAGRAM_CACHE_DIR.stat()
+    except OSError:
+        return None
+    if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        return None
+    return DIAGRAM_CACHE_DIR
+
+
+def _diagram_cache_key(url: str) -> str:
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def _read_cached_diagram(cache_dir: Path, url: str) -> bytes | None:
+    """Read a cached diagram and mark it as recently used."""
+    path = cache_dir / _diagram_cache_key(url)
+    try:
+        content = path.read_bytes()
+        os.utime(path)
+    except OSError:
+        return None
+    return content or None
+
+
+def _write_cached_diagram(cache_dir: Path, url: str, content: bytes) -> None:
+    """Atomically store a diagram in the cache (best effort)."""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp_')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_dir / _diagram_cache_key(url))
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _evict_cached_diagrams(cache_dir: Path) -> None:
+    """Remove least recently used diagrams beyond DIAGRAM_CACHE_MAX_FILES."""
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.is_file() and not e.name.startswith('.')]
+        if len(entries) <= DIAGRAM_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - DIAGRAM_CACHE_MAX_FILES]:
+            os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def _download_diagram(url: str) -> bytes | None:
+    """Download a diagram, giving up once it exceeds MAX_DIAGRAM_BYTES."""
+    try:
+        with _http_session().get(url, timeout=10, stream=True) as response:
+            if not response.ok:
+                return None
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > MAX_DIAGRAM_BYTES:
+                return None
+            content = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                content.extend(chunk)
+                if len(content) > MAX_DIAGRAM_BYTES:
+                    return None
+            return bytes(content)
+    except Exception:
+        return None
+
+
+def _fetch_diagrams(recommendations: list[ArchitectureRecommendation]) -> dict[str, bytes]:
+    """Download recommendation diagrams concurrently (with SSRF protection).
+
+    Diagrams already present in the on-disk cache are served from it;
+    only cache misses hit the network.
+
+    Returns:
+        Mapping of diagram URL to raw image bytes for every diagram that was
+        fetched successfully. Failed downloads are skipped.
+    """
+    urls = []
+    for rec in recommendations:
+        url = rec.diagram_url
+        if url and url not in urls and validate_url(url, allow_http=True)[0]:
+            urls.append(url)
+    if not urls:
+        return {}
+
+    diagrams: dict[str, bytes] = {}
+    cache_dir = _diagram_cache_dir()
+    if cache_dir is not None:
+        for url in urls:
+            content = _read_cached_diagram(cache_dir, url)
+            if content:
+                diagrams[url] = content
+        urls = [url for url in urls if url not in diagrams]
+        if not urls:
+            return diagrams
+
+    if requests is None:
+        return diagrams
+
+    workers = min(MAX_DIAGRAM_FETCH_WORKERS, len(urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for url, content in zip(urls, executor.map(_download_diagram, urls)):
+            if content:
+                diagrams[url] = content
+                if cache_dir is not None:
+                    _write_cached_diagram(cache_dir, url, content)
+
+    if cache_dir is not None:
+        _evict_cached_diagrams(cache_dir)
+
+    return diagrams
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate text to ``limit`` characters, appending an ellipsis if cut."""
+    return text[:limit] + "..." if text[limit:limit + 1] else text
+
+
+def _downsample_raster(content: bytes) -> BytesIO:
+    """Shrink a raster diagram to the resolution it is drawn at.
+
+    ReportLab embeds images at full resolution, so large PNGs inflate the
+    PDF. Images already within DIAGRAM_MAX_PIXELS, or that Pillow cannot
+    decode, are returned unchanged.
+    """
+    if PILImage is None:
+        return BytesIO(content)
+    try:
+        with PILImage.open(BytesIO(content)) as pil:
+            max_w, max_h = DIAGRAM_MAX_PIXELS
+            if pil.width <= max_w and pil.height <= max_h:
+                return BytesIO(content)
+            pil.thumbnail(DIAGRAM_MAX_PIXELS, PILImage.Resampling.LANCZOS)
+            if pil.mode in ('RGBA', 'LA', 'P'):
+                rgba = pil.convert('RGBA')
+                flattened = PILImage.new('RGB', rgba.size, 'white')
+                flattened.paste(rgba, mask=rgba.getchannel('A'))
+            else:
+                flattened = pil.convert('RGB')
+            resized = BytesIO()
+            flattened.save(resized, 'JPEG', quality=85, optimize=True)
+            resized.seek(0)
+            return resized
+    except Exception:
+        return BytesIO(content)
+
+
+def _rasterize_svg(url: str, content: bytes) -> Image | None:
+    """Render an SVG diagram to PNG with cairosvg, reusing the disk cache.
+
+    cairo rasterization is much faster than building an svg2rlg drawing
+    tree for complex diagrams. Returns None if cairosvg is unavailable or
+    fails, so the caller can fall back to svglib.
+    """
+    if cairosvg is None:
+        return None
+
+    cache_dir = _diagram_cache_dir()
+    cache_url = f"{url}#png{DIAGRAM_SVG_RASTER_WIDTH}"
+    png = _read_cached_diagram(cache_dir, cache_url) if cache_dir is not None else None
+    if png is None:
+        try:
+            png = cairosvg.svg2png(
+                bytestring=content, output_width=DIAGRAM_SVG_RASTER_WIDTH, unsafe=False
+            )
+        except Exception:
+            return None
+        if cache_dir is not None:
+            _write_cached_diagram(cache_dir, cache_url, png)
+
+    width_px, height_px = ImageReader(BytesIO(png)).getSize()
+    if not width_px:
+        return None
+    target_width = 5 * inch
+    img = Image(BytesIO(png), width=target_width, height=target_width * height_px / width_px)
+    img.hAlign = 'CENTER'
+    return img
+
+
+def _diagram_flowable(url: str, content: bytes) -> Flowable | None:
+    """Convert downloaded diagram bytes into a flowable sized for the report."""
+    try:
+        if url.lower().endswith('.svg'):
+            image = _rasterize_svg(url, content)
+            if image is not None:
+                return image
+            drawing = svg2rlg(BytesIO(content)) if svg2rlg is not None else None
+            if drawing:
+                target_width = 5 * inch
+                if drawing.width > 0 and abs(drawing.width - target_width) > 0.5:
+                    scale = target_width / drawing.width
+                    drawing.width = target_width
+                    drawing.height = drawing.height * scale
+                    drawing.scale(scale, scale)
+            return drawing
+        img = Image(_downsample_raster(content), width=5 * inch, height=2.5 * inch)
+        img.hAlign = 'CENTER'
+        return img
+    except Exception:
+        return None
+
+
+def _build_diagram_flowables(
+    recommendations: list[ArchitectureRecommendation],
+    diagrams: dict[str, bytes]
+) -> list[Flowable | None]:
+    """Parse/resize downloaded diagrams in parallel, one per recommendation.
+
+    SVG parsing (lxml) and Pillow resampling release the GIL for part of
+    their work, so a thread pool overlaps the per-diagram conversions.
+    Flowables are not shared between recommendations because ReportLab
+    consumes an Image's buffer when it is drawn.
+    """
+    jobs = [
+        (i, rec.diagram_url) for i, rec in enumerate(recommendations)
+        if rec.diagram_url in diagrams
+    ]
+    flowables: list[Flowable | None] = [None] * len(recommendations)
+    if not jobs:
+        return flowables
+
+    workers = min(MAX_DIAGRAM_FETCH_WORKERS, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda job: _diagram_flowable(job[1], diagrams[job[1]]), jobs)
+        for (i, _), flowable in zip(jobs, results):
+            flowables[i] = flowable
+    return flowables
+
+
+def _build_recommendation_section(
+    rec: ArchitectureRecommendation,
+    index: int,
+    styles,
+    diagram: Flowable | None = None
+) -> list:
+    """Build a recommendation section with card styling.
+
+    Args:
+        rec: The recommendation to render
+        index: 1-based rank of the recommendation
+        styles: Stylesheet from _get_custom_styles()
+        diagram: Prepared diagram flowable, if any (see _build_diagram_flowables)
+    """
     elements = []
 
     # Card header with rank and score
@@ -510,61 +837,46 @@ def _build_recommendation_section(rec: ArchitectureRecommendation, index: int, s
     ]]
 
     header_table = Table(header_data, colWidths=[0.5*inch, 4*inch, 2*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BACKGROUND', (0, 0), (0, 0), AZURE_BLUE if index == 1 else (AZURE_GREEN if index <= 3 else TEXT_GRAY)),
-        ('TEXTCOLOR', (0, 0), (0, 0), white),
-        ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-        ('LEFTPADDING', (1, 0), (1, 0), 10),
-    ]))
+    if index == 1:
+        header_table.setStyle(_HEADER_TABLE_STYLE_FIRST)
+    elif index <= 3:
+        header_table.setStyle(_HEADER_TABLE_STYLE_TOP3)
+    else:
+        header_table.setStyle(_HEADER_TABLE_STYLE_OTHER)
     elements.append(header_table)
 
     # Pattern and quality badges
     quality_label = rec.catalog_quality.value.replace('_', ' ').title()
-    quality_color = AZURE_GREEN if 'curated' in quality_label.lower() else (
-        AZURE_BLUE if 'enriched' in quality_label.lower() else TEXT_GRAY
+    quality_style = _QUALITY_STYLE_BY_VALUE.get(rec.catalog_quality.value, _DEFAULT_QUALITY_STYLE)
+
+    pattern_text = f"Pattern: {rec.pattern_name} | Quality:"
+    # Columns sized to the text (+1pt slack so it doesn't wrap early); only
+    # a pattern name too long for the line wraps
+    label_width = stringWidth(quality_label, 'Helvetica-Bold', 9) + 1
+    pattern_width = min(
+        stringWidth(pattern_text, 'Helvetica', 9) + 1,
+        _PATTERN_LINE_WIDTH - label_width - _PATTERN_LABEL_GAP,
+    )
+    pattern_line = Table(
+        [[Paragraph(pattern_text, styles['MetaText']),
+          Paragraph(quality_label, styles[quality_style])]],
+        colWidths=[pattern_width, label_width + _PATTERN_LABEL_GAP],
+        hAlign='LEFT',
     )
+    pattern_line.setStyle(_PATTERN_LINE_TABLE_STYLE)
 
     elements.append(Spacer(1, 0.08 * inch))
-    elements.append(Paragraph(
-        f"<font color='#605E5C'>Pattern: {rec.pattern_name} | Quality: </font>"
-        f"<font color='{quality_color.hexval()}'><b>{quality_label}</b></font>",
-        styles['MetaText']
-    ))
+    elements.append(pattern_line)
 
     # Description
     if rec.description:
         elements.append(Spacer(1, 0.1 * inch))
-        desc = rec.description[:400] + "..." if len(rec.description) > 400 else rec.description
-        elements.append(Paragraph(desc, styles['Normal']))
+        elements.append(Paragraph(_truncate(rec.description, 400), styles['Normal']))
 
-    # Try to include diagram image (with SSRF protection)
-    if rec.diagram_url:
-        url_valid, url_error = validate_url(rec.diagram_url, allow_http=True)
-        if url_valid:
-            try:
-                import requests
-                response = requests.get(rec.diagram_url, timeout=10)
-                if response.ok:
-                    img_buffer = BytesIO(response.content)
-                    if rec.diagram_url.lower().endswith('.svg'):
-                        from svglib.svglib import svg2rlg
-                        drawing = svg2rlg(img_buffer)
-                        if drawing:
-                            target_width = 5 * inch
-                            scale = target_width / drawing.width if drawing.width > 0 else 1
-                            drawing.width = target_width
-                            drawing.height = drawing.height * scale
-                            drawing.scale(scale, scale)
-                            elements.append(Spacer(1, 0.1 * inch))
-                            elements.append(drawing)
-                    else:
-                        img = Image(img_buffer, width=5 * inch, height=2.5 * inch)
-                        img.hAlign = 'CENTER'
-                        elements.append(Spacer(1, 0.1 * inch))
-                        elements.append(img)
-            except Exception:
-                pass
+    # Include diagram if one was fetched and prepared
+    if diagram is not None:
+        elements.append(Spacer(1, 0.1 * inch))
+        elements.append(diagram)
 
     elements.append(Spacer(1, 0.1 * inch))
 
@@ -589,10 +901,7 @@ def _build_recommendation_section(rec: ArchitectureRecommendation, index: int, s
             right_col.append(Spacer(1, 0.12*inch))
 
         fit_table = Table([[left_col, right_col]], colWidths=[3.25*inch, 3.25*inch])
-        fit_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ]))
+        fit_table.setStyle(_FIT_TABLE_STYLE)
         elements.append(fit_table)
 
     # Core services
@@ -612,15 +921,21 @@ def _build_recommendation_section(rec: ArchitectureRecommendation, index: int, s
             styles['MetaText']
         ))
 
-    # Card bottom border/spacer
-    elements.append(Spacer(1, 0.15 * inch))
-    elements.append(HRFlowable(width="100%", thickness=1, color=MEDIUM_GRAY, spaceBefore=5, spaceAfter=15))
+    # Card bottom border
+    elements.append(HRFlowable(
+        width="100%", thickness=1, color=MEDIUM_GRAY, spaceBefore=0.15 * inch + 5, spaceAfter=15
+    ))
 
     return elements
 
 
+@lru_cache(maxsize=1)
 def _get_custom_styles():
-    """Create custom paragraph styles for the report."""
+    """Create custom paragraph styles for the report.
+
+    The stylesheet is built once per process and shared between reports;
+    callers must treat it as read-only.
+    """
     styles = getSampleStyleSheet()
 
     # Cover page styles
@@ -672,6 +987,13 @@ def _get_custom_styles():
         spaceAfter=4
     ))
 
+    # Section title that follows other content on the same page
+    styles.add(ParagraphStyle(
+        'SpacedSectionTitle',
+        parent=styles['SectionTitle'],
+        spaceBefore=20 + 0.3 * inch
+    ))
+
     styles.add(ParagraphStyle(
         'SubsectionTitle',
         parent=styles['Heading2'],
@@ -724,6 +1046,19 @@ def _get_custom_styles():
         fontSize=9
     ))
 
+    # Quality label on the pattern line, colored by catalog quality
+    for name, color in (
+        ('QualityCurated', AZURE_GREEN),
+        ('QualityEnriched', AZURE_BLUE),
+        ('QualityOther', TEXT_GRAY),
+    ):
+        styles.add(ParagraphStyle(
+            name,
+            parent=styles['MetaText'],
+            textColor=color,
+            fontName='Helvetica-Bold'
+        ))
+
     styles.add(ParagraphStyle(
         'CheckItem',
         parent=styles['Normal'],
@@ -737,7 +1072,7 @@ def _get_custom_styles():
     styles.add(ParagraphStyle(
         'WarningItem',
         parent=styles['Normal'],
-        textColor=HexColor('#B7791F'),  # Darker yellow/orange for readability
+        textColor=WARNING_ORANGE,
         fontSize=10,
         leftIndent=10,
         spaceBefore=2,
@@ -1,14 +1,62 @@
 """Documentation page - Browse and read project documentation."""
 
+import bisect
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
 
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
+# Paths derived once from this file: pages/ -> app package -> src/ -> repo root
+_HERE = Path(__file__).resolve().parent
+_SRC = _HERE.parents[1]
+_REPO_ROOT = _HERE.parents[2]
+_DEFAULT_DOCS = _REPO_ROOT / "docs"
+
 # Add src to path for imports
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+
+# "Edit on GitHub" links are this prefix plus the doc filename
+_GH_DOC_URL_PREFIX = "https://github.com/adamswbrown/azure-architecture-categoriser/blob/main/docs/"
+
+# Custom CSS for documentation styling (built once at import)
+_PAGE_CSS = """
+<style>
+/* Main content max width for readability */
+.main .block-container {
+    max-width: 1000px;
+    padding-top: 2rem;
+}
+
+/* Server-rendered markdown (st.html doesn't get Streamlit's markdown styles) */
+.doc-content table {
+    border-collapse: collapse;
+    margin: 0.5rem 0 1rem;
+}
+.doc-content th, .doc-content td {
+    border: 1px solid rgba(128, 128, 128, 0.3);
+    padding: 0.3rem 0.6rem;
+}
+.doc-content pre {
+    background: rgba(128, 128, 128, 0.1);
+    border-radius: 0.5rem;
+    padding: 0.75rem 1rem;
+    overflow-x: auto;
+}
+.doc-content code {
+    font-size: 0.875em;
+}
+</style>
+"""
 
 
 # Documentation metadata for nice display
@@ -75,6 +123,28 @@ DOC_METADATA = {
     },
 }
 
+# Level-2/3 markdown headings, matched in one pass over the whole document
+_HEADING_RE = re.compile(r"(?m)^(#{2,3}) (.+)$")
+
+# Level-2 headings mark section boundaries; fences let us skip headings in code blocks
+_SECTION_RE = re.compile(r"(?m)^## (.+)$")
+_FENCE_RE = re.compile(r"(?m)^[ \t]*(?:```|~~~)")
+
+# Sections rendered eagerly; later ones are collapsed into expanders
+EAGER_SECTION_COUNT = 2
+
+# Documents larger than this are written section by section when shown in full
+PROGRESSIVE_RENDER_BYTES = 50_000
+
+# Server-side markdown renderer (raw HTML in docs stays escaped, as with st.markdown)
+_MD = (
+    MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+    if MarkdownIt else None
+)
+
+# Heading text -> anchor slug (spaces to dashes, drop . ( ))
+_ANCHOR_TABLE = str.maketrans({" ": "-", ".": None, "(": None, ")": None})
+
 # Category order for display
 CATEGORY_ORDER = [
     "Core Components",
@@ -86,12 +156,12 @@ CATEGORY_ORDER = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_docs_directory() -> Path | None:
-    """Find the docs directory."""
+    """Find the docs directory (resolved once per server process)."""
     # Try relative to this file
-    docs_dir = Path(__file__).parent.parent.parent.parent / "docs"
-    if docs_dir.exists():
-        return docs_dir
+    if _DEFAULT_DOCS.exists():
+        return _DEFAULT_DOCS
 
     # Try relative to cwd
     docs_dir = Path.cwd() / "docs"
@@ -106,59 +176,171 @@ def get_docs_directory() -> Path | None:
     return None
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _read_doc_text(path_str: str, mtime_ns: int) -> str:
+    """Read a doc file; mtime_ns is part of the cache key so edits invalidate it."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
 def load_doc_content(docs_dir: Path, filename: str) -> str | None:
     """Load a documentation file's content."""
     try:
         doc_path = docs_dir / filename
-        if doc_path.exists():
-            return doc_path.read_text(encoding="utf-8")
+        return _read_doc_text(str(doc_path), doc_path.stat().st_mtime_ns)
     except Exception:
         pass
     return None
 
 
-def get_available_docs(docs_dir: Path) -> list[dict]:
-    """Get list of available documentation files with metadata."""
-    docs = []
+def get_available_docs(docs_dir: Path) -> dict:
+    """Get available documentation files with metadata.
 
-    for md_file in sorted(docs_dir.glob("*.md")):
-        filename = md_file.name
+    Returns ``{"flat": [...], "by_category": {category: [...]},
+    "filenames": (...)}``. The listing is cached briefly so sidebar reruns
+    don't rescan or regroup docs/.
+    Use ``docs_dir / doc["filename"]`` to get a file's path.
+    """
+    return _list_docs(str(docs_dir))
 
-        # Skip design docs and internal files
-        if filename.startswith("_") or "/design/" in str(md_file):
-            continue
 
+def _group_by_category(docs: list[dict]) -> dict[str, list[dict]]:
+    """Group doc metadata dicts by category, preserving order."""
+    docs_by_category: dict[str, list[dict]] = {}
+    for doc in docs:
+        docs_by_category.setdefault(doc.get("category", "Other"), []).append(doc)
+    return docs_by_category
+
+
+@lru_cache(maxsize=64)
+def _default_metadata(filename: str) -> dict:
+    """Build display metadata for a doc missing from DOC_METADATA."""
+    return {
+        "title": filename.replace(".md", "").replace("-", " ").title(),
+        "icon": "📄",
+        "description": "",
+        "category": "Other",
+    }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_docs(docs_dir_str: str) -> dict:
+    """Scan a docs directory and build metadata dicts (cached by directory)."""
+    docs = []
+
+    # Work with entry names rather than building a Path per file. Only the
+    # top level is scanned, so design/ docs are skipped; so are _internal files.
+    with os.scandir(docs_dir_str) as it:
+        filenames = sorted(
+            e.name for e in it
+            if e.name[0] != "_" and e.name.endswith(".md") and e.is_file()
+        )
+
+    for filename in filenames:
         # Get metadata or create default
-        metadata = DOC_METADATA.get(filename, {
-            "title": filename.replace(".md", "").replace("-", " ").title(),
-            "icon": "📄",
-            "description": "",
-            "category": "Other",
-        })
+        metadata = DOC_METADATA.get(filename)
+        if metadata is None:
+            metadata = _default_metadata(filename)
 
         docs.append({
             "filename": filename,
-            "path": md_file,
             **metadata,
+            # Case-folded haystack so search doesn't re-lower every keystroke
+            "_search": f"{metadata['title']}\x00{metadata.get('description', '')}".lower(),
         })
 
-    return docs
+    return {
+        "flat": docs,
+        "by_category": _group_by_category(docs),
+        # Identifies this listing across reruns; st.cache_data hands back a
+        # fresh copy each time, so object identity can't be used
+        "filenames": tuple(filenames),
+    }
 
 
-def render_table_of_contents(content: str) -> None:
-    """Extract and render a table of contents from markdown headings."""
-    lines = content.split("\n")
+@st.cache_data(max_entries=32, show_spinner=False)
+def _extract_toc(content: str) -> list[dict]:
+    """Extract level-2/3 headings from markdown (cached by content)."""
     toc_items = []
 
-    for line in lines:
-        if line.startswith("## "):
-            heading = line[3:].strip()
-            anchor = heading.lower().replace(" ", "-").replace(".", "").replace("(", "").replace(")", "")
-            toc_items.append({"level": 2, "text": heading, "anchor": anchor})
-        elif line.startswith("### "):
-            heading = line[4:].strip()
-            anchor = heading.lower().replace(" ", "-").replace(".", "").replace("(", "").replace(")", "")
-            toc_items.append({"level": 3, "text": heading, "anchor": anchor})
+    for match in _HEADING_RE.finditer(content):
+        heading = match.group(2).strip()
+        anchor = heading.lower().translate(_ANCHOR_TABLE)
+        toc_items.append({"level": len(match.group(1)), "text": heading, "anchor": anchor})
+
+    return toc_items
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _split_sections(content: str) -> list[tuple[str, str]]:
+    """Split markdown into (title, body) pairs at level-2 headings.
+
+    Headings inside fenced code blocks are ignored. Any text before the
+    first heading is returned as a leading section with an empty title.
+    Each body starts with its own heading line.
+    """
+    fence_starts = [m.start() for m in _FENCE_RE.finditer(content)]
+    sections = []
+    start = 0
+    title = ""
+
+    for match in _SECTION_RE.finditer(content):
+        # An odd number of fences before the heading means it is inside a code block
+        if bisect.bisect_left(fence_starts, match.start()) % 2:
+            continue
+        if match.start() > start or title:
+            sections.append((title, content[start:match.start()]))
+        start = match.start()
+        title = match.group(1).strip()
+
+    sections.append((title, content[start:]))
+    return sections
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_markdown_html(content: str) -> str:
+    """Render markdown to HTML once per distinct content (cached)."""
+    return f'<div class="doc-content">{_MD.render(content)}</div>'
+
+
+def _write_markdown(content: str) -> None:
+    """Write markdown as pre-rendered HTML, or via st.markdown without markdown-it."""
+    if _MD is None:
+        st.markdown(content)
+    else:
+        st.html(render_markdown_html(content))
+
+
+def render_doc_content(content: str) -> None:
+    """Render a document, collapsing later sections into expanders.
+
+    Only the preamble and the first EAGER_SECTION_COUNT sections are
+    rendered up front; the rest stay collapsed until expanded.
+    """
+    sections = _split_sections(content)
+    eager_count = EAGER_SECTION_COUNT + (1 if not sections[0][0] else 0)
+
+    render_full = st.toggle("Render full document", value=False, key="doc_render_full")
+    if render_full or len(sections) <= eager_count:
+        if len(content) > PROGRESSIVE_RENDER_BYTES:
+            # One element per section lets the browser paint as each arrives
+            for _, body in sections:
+                _write_markdown(body)
+        else:
+            _write_markdown(content)
+        return
+
+    for _, body in sections[:eager_count]:
+        _write_markdown(body)
+
+    for title, body in sections[eager_count:]:
+        with st.expander(title, expanded=False):
+            # The expander label already shows the heading
+            _write_markdown(body[body.find("\n") + 1:] if "\n" in body else "")
+
+
+def render_table_of_contents(content: str) -> None:
+    """Extract and render a table of contents from markdown headings."""
+    toc_items = _extract_toc(content)
 
     if toc_items:
         with st.expander("📑 Table of Contents", expanded=False):
@@ -167,89 +349,109 @@ def render_table_of_contents(content: str) -> None:
                 st.markdown(f"{indent}- {item['text']}")
 
 
-def render_sidebar_navigation(available_docs: list[dict], filtered_docs: list[dict]) -> None:
-    """Render the documentation navigation in the sidebar."""
-    with st.sidebar:
-        st.markdown("---")
-        st.markdown("### 📖 Doc Navigation")
-        st.caption("Select a document to read")
-
-        # Search
-        search_term = st.text_input(
-            "Search docs",
-            placeholder="Search...",
-            label_visibility="collapsed",
-            key="doc_search"
-        )
+_DOC_RADIO_PREFIX = "doc_radio_"
 
-        # Filter docs by search
-        if search_term:
-            filtered_docs = [
-                d for d in available_docs
-                if search_term.lower() in d["title"].lower()
-                or search_term.lower() in d.get("description", "").lower()
-            ]
-
-        # Get or set selected doc
-        if "selected_doc" not in st.session_state:
-            st.session_state.selected_doc = filtered_docs[0]["filename"] if filtered_docs else None
-
-        # Group docs by category
-        docs_by_category: dict[str, list] = {}
-        for doc in filtered_docs:
-            category = doc.get("category", "Other")
-            if category not in docs_by_category:
-                docs_by_category[category] = []
-            docs_by_category[category].append(doc)
-
-        # Render docs grouped by category
-        for category in CATEGORY_ORDER:
-            if category in docs_by_category:
-                st.markdown(f"**{category}**")
-
-                for doc in docs_by_category[category]:
-                    is_selected = st.session_state.selected_doc == doc["filename"]
-
-                    if st.button(
-                        f"{doc['icon']} {doc['title']}",
-                        key=f"btn_{doc['filename']}",
-                        use_container_width=True,
-                        type="primary" if is_selected else "secondary",
-                    ):
-                        st.session_state.selected_doc = doc["filename"]
-                        st.rerun()
-
-                st.markdown("")  # Spacer between categories
-
-        # Handle "Other" category
-        if "Other" in docs_by_category:
-            st.markdown("**Other**")
-            for doc in docs_by_category["Other"]:
-                is_selected = st.session_state.selected_doc == doc["filename"]
-                if st.button(
-                    f"{doc['icon']} {doc['title']}",
-                    key=f"btn_{doc['filename']}",
-                    use_container_width=True,
-                    type="primary" if is_selected else "secondary",
-                ):
-                    st.session_state.selected_doc = doc["filename"]
-                    st.rerun()
-
-        # Footer
-        st.markdown("---")
-        st.markdown(
-            """
-            <div style="text-align: center; padding: 0.5rem 0; color: #666; font-size: 0.8rem;">
-                <p style="margin-bottom: 0.5rem;">
-                    Built by <a href="https://askadam.cloud/#about" target="_blank"><strong>Adam Brown</strong></a>
-                </p>
-                <a href="https://github.com/adamswbrown/azure-architecture-categoriser" target="_blank">
-                    <img src="https://img.shields.io/badge/GitHub-181717?style=flat&logo=github" alt="GitHub"/>
-                </a>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+
+def _on_doc_selected(changed_key: str) -> None:
+    """Make the changed radio's doc current and clear the other categories."""
+    st.session_state.selected_doc = st.session_state[changed_key]
+    st.session_state["_doc_changed"] = True
+    for key in list(st.session_state.keys()):
+        if key.startswith(_DOC_RADIO_PREFIX) and key != changed_key:
+            st.session_state[key] = None
+
+
+def _render_category_radio(category: str, docs: list[dict]) -> None:
+    """Render one category's docs as a single radio widget."""
+    options = [d["filename"] for d in docs]
+    labels = {d["filename"]: f"{d['icon']} {d['title']}" for d in docs}
+    key = f"{_DOC_RADIO_PREFIX}{category}"
+
+    # Reflect the current selection (or none) when options change, e.g. on search
+    selected = st.session_state.selected_doc
+    if st.session_state.get(key) not in options:
+        st.session_state[key] = selected if selected in options else None
+
+    st.radio(
+        category,
+        options,
+        format_func=labels.__getitem__,
+        key=key,
+        on_change=_on_doc_selected,
+        args=(key,),
+        label_visibility="collapsed",
+    )
+
+
+@st.fragment
+def render_sidebar_navigation(docs: dict) -> None:
+    """Render the documentation navigation; call inside ``st.sidebar``.
+
+    Runs as a fragment so searching only reruns the sidebar. Picking a doc
+    triggers a full app rerun to redraw the content area.
+    """
+    st.markdown("---")
+    st.markdown("### 📖 Doc Navigation")
+    st.caption("Select a document to read")
+
+    # Search
+    search_term = st.text_input(
+        "Search docs",
+        placeholder="Search...",
+        label_visibility="collapsed",
+        key="doc_search"
+    )
+
+    # Filter docs by search; only a filtered subset needs regrouping.
+    # Results are kept in session state so non-search reruns (e.g. picking
+    # a doc) reuse them instead of rescanning. They're keyed on the listing
+    # too, so a refreshed docs/ scan isn't hidden behind stale results.
+    if search_term:
+        cache_key = (search_term, docs["filenames"])
+        last = st.session_state.get("_doc_search_cache")
+        if last and last[0] == cache_key:
+            filtered_docs, docs_by_category = last[1], last[2]
+        else:
+            needle = search_term.lower()
+            filtered_docs = [d for d in docs["flat"] if needle in d["_search"]]
+            docs_by_category = _group_by_category(filtered_docs)
+            st.session_state["_doc_search_cache"] = (
+                cache_key, filtered_docs, docs_by_category,
+            )
+    else:
+        filtered_docs = docs["flat"]
+        docs_by_category = docs["by_category"]
+
+    # Get or set selected doc
+    if "selected_doc" not in st.session_state:
+        st.session_state.selected_doc = filtered_docs[0]["filename"] if filtered_docs else None
+
+    # Render docs grouped by category, one radio group per category
+    for category in [*CATEGORY_ORDER, "Other"]:
+        if category in docs_by_category:
+            st.markdown(f"**{category}**")
+            _render_category_radio(category, docs_by_category[category])
+            st.markdown("")  # Spacer between categories
+
+    # A new selection needs the content area redrawn, not just this fragment
+    if st.session_state.pop("_doc_changed", False):
+        st.rerun()
+
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        """
+        <div style="text-align: center; padding: 0.5rem 0; color: #666; font-size: 0.8rem;">
+            <p style="margin-bottom: 0.5rem;">
+                Built by <a href="https://askadam.cloud/#about" target="_blank"><strong>Adam Brown</strong></a>
+            </p>
+            <a href="https://github.com/adamswbrown/azure-architecture-categoriser" target="_blank">
+                <img src="https://img.shields.io/badge/GitHub-181717?style=flat&logo=github" alt="GitHub"/>
+            </a>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
 
 
 def main():
@@ -260,23 +462,7 @@ def main():
     )
 
     # Custom CSS for documentation styling
-    st.markdown("""
-    <style>
-    /* Sidebar button styling */
-    section[data-testid="stSidebar"] .stButton > button {
-        text-align: left !important;
-        justify-content: flex-start !important;
-        padding: 0.4rem 0.8rem !important;
-        font-size: 0.9rem !important;
-    }
-
-    /* Main content max width for readability */
-    .main .block-container {
-        max-width: 1000px;
-        padding-top: 2rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_PAGE_CSS, unsafe_allow_html=True)
 
     # Get docs directory
     docs_dir = get_docs_directory()
@@ -287,14 +473,16 @@ def main():
         return
 
     # Get available docs
-    available_docs = get_available_docs(docs_dir)
+    docs = get_available_docs(docs_dir)
+    available_docs = docs["flat"]
 
     if not available_docs:
         st.warning("No documentation files found.")
         return
 
     # Render navigation in sidebar (sticky by default)
-    render_sidebar_navigation(available_docs, available_docs)
+    with st.sidebar:
+        render_sidebar_navigation(docs)
 
     # Main content area
     selected_filename = st.session_state.get("selected_doc")
@@ -322,18 +510,18 @@ def main():
                 render_table_of_contents(content)
 
                 # Remove the first H1 heading (we already display title)
-                lines = content.split("\n")
-                if lines and lines[0].startswith("# "):
-                    content = "\n".join(lines[1:])
+                if content.startswith("# "):
+                    first_newline = content.find("\n")
+                    content = content[first_newline + 1:] if first_newline != -1 else ""
 
                 # Render the markdown content
-                st.markdown(content)
+                render_doc_content(content)
 
                 # Footer with links
                 st.markdown("---")
                 col1, col2 = st.columns(2)
                 with col1:
-                    github_url = f"https://github.com/adamswbrown/azure-architecture-categoriser/blob/main/docs/{selected_filename}"
+                    github_url = _GH_DOC_URL_PREFIX + selected_filename
                     st.markdown(f"[📝 Edit on GitHub]({github_url})")
                 with col2:
                     st.caption(f"Source: `docs/{selected_filename}`")
@@ -1,16 +1,22 @@
-"""Utility functions for the recommendations app."""
-
-from architecture_recommendations_app.utils.validation import validate_uploaded_file
-from architecture_recommendations_app.utils.sanitize import (
-    safe_html,
-    safe_html_attr,
-    validate_url,
-    safe_url,
-    secure_temp_file,
-    secure_temp_directory,
-    sanitize_filename,
-    ALLOWED_URL_DOMAINS,
-)
+"""Utility functions for the recommendations app.
+
+Re-exports are resolved lazily (PEP 562) so importing one submodule, e.g.
+``utils.sanitize``, doesn't also import ``utils.validation``.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "validate_uploaded_file": "validation",
+    "safe_html": "sanitize",
+    "safe_html_attr": "sanitize",
+    "validate_url": "sanitize",
+    "safe_url": "sanitize",
+    "secure_temp_file": "sanitize",
+    "secure_temp_directory": "sanitize",
+    "sanitize_filename": "sanitize",
+    "ALLOWED_URL_DOMAINS": "sanitize",
+}
 
 __all__ = [
     "validate_uploaded_file",
@@ -23,3 +29,16 @@ __all__ = [
     "sanitize_filename",
     "ALLOWED_URL_DOMAINS",
 ]
+
+
+def __getattr__(name: str):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,16 @@ validating URLs, and secure temporary file handling.
 Security audit: 2024 - Addresses XSS, SSRF, and temp file vulnerabilities.
 """
 
+import bisect
 import html
 import ipaddress
 import os
+import re
+import socket
+import sys
 import tempfile
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generator, Optional
 from urllib.parse import urlparse
@@ -34,8 +39,21 @@ ALLOWED_URL_DOMAINS = frozenset([
     'raw.githubusercontent.com',
 ])
 
+# http(s)://, DNS labels ending in an allowed domain, optional port, then a path
+# or end of string. ASCII-only so case folding can't admit lookalike characters.
+_FAST_ALLOWED_URL_RE = re.compile(
+    r'(https?)://(?:[a-z0-9-]+\.)*(?:'
+    + '|'.join(re.escape(d) for d in sorted(ALLOWED_URL_DOMAINS))
+    + r')(?::\d+)?(?:/|\Z)',
+    re.IGNORECASE | re.ASCII,
+)
+
+# Characters urlparse strips from the start of a URL / removes anywhere in it
+_URL_LSTRIP_CHARS = ''.join(map(chr, range(0x21)))
+_URL_REMOVE_CHARS = str.maketrans('', '', '\t\r\n')
+
 # Blocked IP ranges (RFC 1918, loopback, link-local, etc.)
-BLOCKED_IP_RANGES = [
+BLOCKED_IP_RANGES = (
     ipaddress.ip_network('10.0.0.0/8'),
     ipaddress.ip_network('172.16.0.0/12'),
     ipaddress.ip_network('192.168.0.0/16'),
@@ -44,7 +62,32 @@ BLOCKED_IP_RANGES = [
     ipaddress.ip_network('::1/128'),  # IPv6 loopback
     ipaddress.ip_network('fc00::/7'),  # IPv6 private
     ipaddress.ip_network('fe80::/10'),  # IPv6 link-local
-]
+)
+
+
+def _build_ip_intervals(version: int) -> tuple[list[int], list[int]]:
+    """Merge BLOCKED_IP_RANGES of one IP version into sorted (lo, hi) bounds."""
+    spans = sorted(
+        (int(net.network_address), int(net.broadcast_address))
+        for net in BLOCKED_IP_RANGES
+        if net.version == version
+    )
+    lows: list[int] = []
+    highs: list[int] = []
+    for lo, hi in spans:
+        if highs and lo <= highs[-1] + 1:
+            highs[-1] = max(highs[-1], hi)
+        else:
+            lows.append(lo)
+            highs.append(hi)
+    return lows, highs
+
+
+# Sorted, non-overlapping integer bounds per IP version, for bisect lookups
+_BLOCKED_IP_INTERVALS = {
+    4: _build_ip_intervals(4),
+    6: _build_ip_intervals(6),
+}
 
 # Cloud metadata endpoints to block
 BLOCKED_HOSTNAMES = frozenset([
@@ -92,27 +135,43 @@ def safe_html_attr(value: Any) -> str:
 
 def _is_ip_blocked(hostname: str) -> bool:
     """Check if a hostname resolves to a blocked IP range."""
-    try:
-        # Try to parse as IP address directly
-        ip = ipaddress.ip_address(hostname)
-        return any(ip in network for network in BLOCKED_IP_RANGES)
-    except ValueError:
-        # Not an IP address, hostname will be checked against domain list
+    # IPv4 literals end in a digit and IPv6 literals contain ':'; skip parsing
+    # for ordinary DNS names, whose last label can't be all-numeric
+    if not hostname or not (hostname[-1].isdigit() or ':' in hostname):
         return False
 
+    # Not an IP address -> False; the hostname is checked against the domain list
+    if ':' in hostname:
+        try:
+            ip_int = int(ipaddress.IPv6Address(hostname))
+        except ValueError:
+            return False
+        lows, highs = _BLOCKED_IP_INTERVALS[6]
+    else:
+        # inet_aton is a single C call, and it also accepts the short and
+        # hex forms resolvers do (e.g. 127.1, 0x7f000001)
+        try:
+            ip_int = int.from_bytes(socket.inet_aton(hostname), 'big')
+        except (OSError, ValueError):
+            return False
+        lows, highs = _BLOCKED_IP_INTERVALS[4]
+
+    i = bisect.bisect_right(lows, ip_int) - 1
+    return i >= 0 and ip_int <= highs[i]
+
 
-def _get_domain_suffix(hostname: str) -> str:
-    """Extract the registrable domain from a hostname.
+def _is_domain_allowed(hostname: str, allowed_domains: frozenset[str]) -> bool:
+    """Check whether a lowercase hostname or any parent domain is allowed.
 
-    Examples:
-        docs.microsoft.com -> microsoft.com
-        sub.example.azure.com -> azure.com
+    Probes suffixes right to left without splitting into a list, e.g.
+    docs.microsoft.com -> com, microsoft.com, docs.microsoft.com.
     """
-    parts = hostname.lower().split('.')
-    if len(parts) >= 2:
-        # Return last two parts (e.g., microsoft.com)
-        return '.'.join(parts[-2:])
-    return hostname.lower()
+    dot = len(hostname)
+    while dot != -1:
+        dot = hostname.rfind('.', 0, dot)
+        if hostname[dot + 1:] in allowed_domains:
+            return True
+    return False
 
 
 def validate_url(
@@ -141,30 +200,53 @@ def validate_url(
         >>> validate_url("http://169.254.169.254/latest/meta-data/")
         (False, "URL hostname is blocked")
     """
+    if not isinstance(url, str):
+        return False, "Invalid URL format"
     if allowed_domains is None:
-        allowed_domains = ALLOWED_URL_DOMAINS
+        # Results against the default allowlist only depend on the arguments
+        return _validate_url_default(url, allow_http)
+    return _check_url(url, allowed_domains, allow_http)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_default(url: str, allow_http: bool) -> tuple[bool, str]:
+    """validate_url() against ALLOWED_URL_DOMAINS, memoized per (url, allow_http)."""
+    # Plain allowlisted URLs are accepted by one regex match; anything else
+    # (including every rejection) goes through the full checks for its message
+    match = _FAST_ALLOWED_URL_RE.match(url)
+    if match and (allow_http or len(match.group(1)) == 5):
+        return True, ""
+    return _check_url(url, ALLOWED_URL_DOMAINS, allow_http)
+
+
+def _check_url(
+    url: str,
+    allowed_domains: frozenset[str],
+    allow_http: bool,
+) -> tuple[bool, str]:
+    """Run the validate_url() checks against an explicit allowlist."""
+    if not isinstance(url, str):
+        return False, "Invalid URL format"
+
+    # Check scheme on the prefix, so bad schemes are rejected before urlparse.
+    # Normalise it the way urlparse does (strip leading C0 controls and
+    # spaces, drop tabs and newlines) so the same URLs are accepted.
+    head = url.lstrip(_URL_LSTRIP_CHARS).translate(_URL_REMOVE_CHARS)[:8].lower()
+    if not (head.startswith('https://') or (allow_http and head.startswith('http://'))):
+        return False, f"URL scheme must be {'HTTPS' if not allow_http else 'HTTPS or HTTP'}"
 
     try:
         parsed = urlparse(url)
     except Exception:
         return False, "Invalid URL format"
 
-    # Check scheme
-    allowed_schemes = {'https'}
-    if allow_http:
-        allowed_schemes.add('http')
-
-    if parsed.scheme.lower() not in allowed_schemes:
-        return False, f"URL scheme must be {'HTTPS' if not allow_http else 'HTTPS or HTTP'}"
-
     # Check for hostname
-    if not parsed.netloc:
+    # hostname is lowercased with any userinfo, port and IPv6 brackets removed
+    hostname = parsed.hostname
+    if not hostname:
         return False, "URL must have a hostname"
-
-    hostname = parsed.netloc.lower()
-    # Strip port if present
-    if ':' in hostname:
-        hostname = hostname.split(':')[0]
+    # Repeated CDN/docs hosts then share one string with a cached hash
+    hostname = sys.intern(hostname)
 
     # Check blocked hostnames
     if hostname in BLOCKED_HOSTNAMES:
@@ -175,8 +257,7 @@ def validate_url(
         return False, "URL points to a private/internal IP address"
 
     # Check domain allowlist
-    domain_suffix = _get_domain_suffix(hostname)
-    if domain_suffix not in allowed_domains and hostname not in allowed_domains:
+    if not _is_domain_allowed(hostname, allowed_domains):
         return False, f"URL domain '{hostname}' is not in the allowed list"
 
     return True, ""
@@ -235,8 +316,9 @@ def secure_temp_file(
         fd, temp_path_str = tempfile.mkstemp(suffix=suffix, prefix=prefix)
         temp_path = Path(temp_path_str)
 
-        # Set restrictive permissions explicitly
-        os.chmod(temp_path, 0o600)
+        # mkstemp already uses 0o600 on POSIX; set it explicitly elsewhere
+        if os.name != 'posix':
+            os.chmod(temp_path, 0o600)
 
         # Open the file with the requested mode
         if 'b' in mode:
@@ -282,8 +364,9 @@ def secure_temp_directory(
     temp_dir = None
     try:
         temp_dir = Path(tempfile.mkdtemp(prefix=prefix))
-        # Set restrictive permissions
-        os.chmod(temp_dir, 0o700)
+        # mkdtemp already uses 0o700 on POSIX; set it explicitly elsewhere
+        if os.name != 'posix':
+            os.chmod(temp_dir, 0o700)
         yield temp_dir
     finally:
         if temp_dir is not None and temp_dir.exists():
@@ -294,6 +377,10 @@ def secure_temp_directory(
                 pass  # Best effort cleanup
 
 
+# Path separators -> underscore, null bytes removed
+_FILENAME_TRANSLATION = str.maketrans({'/': '_', '\\': '_', '\x00': None})
+
+
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """Sanitize a filename to prevent path traversal attacks.
 
@@ -306,10 +393,8 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove path separators and null bytes
-    sanitized = filename.replace('/', '_').replace('\\', '_').replace('\x00', '')
-    # Remove leading dots (hidden files, parent directory)
-    sanitized = sanitized.lstrip('.')
+    # Remove path separators and null bytes, then leading dots (hidden files, parent directory)
+    sanitized = filename.translate(_FILENAME_TRANSLATION).lstrip('.')
     # Truncate to max length
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length]
@@ -1,8 +1,14 @@
 """Validation utilities for uploaded context files."""
 
 import json
+from functools import lru_cache
 from typing import Tuple, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
@@ -170,6 +176,12 @@ Return the data in this exact JSON structure:
 - If a data source returns no results, use an empty array []
 - Return ONLY the JSON object, no additional text or explanation'''
 
+# The template with its {{ }} escapes resolved, split around the single
+# {app_name} slot so building a prompt is a plain concatenation
+_DRMIGRATE_PROMPT_PREFIX, _DRMIGRATE_PROMPT_SUFFIX = DRMIGRATE_LLM_PROMPT.format(
+    app_name="\x00"
+).split("\x00")
+
 
 def detect_file_format(data: dict) -> str:
     """Detect whether the data is App Cat format or Dr. Migrate format.
@@ -179,15 +191,18 @@ def detect_file_format(data: dict) -> str:
         'drmigrate' - Dr. Migrate LLM export format
         'unknown' - Unrecognized format
     """
+    if not isinstance(data, dict):
+        return "unknown"
+
     # App Cat format has: app_overview (array), detected_technology_running, server_details
-    if isinstance(data, dict):
-        if "app_overview" in data and isinstance(data.get("app_overview"), list):
-            if "detected_technology_running" in data or "server_details" in data:
-                return "appcat"
+    if isinstance(data.get("app_overview"), list) and (
+        "detected_technology_running" in data or "server_details" in data
+    ):
+        return "appcat"
 
-        # Dr. Migrate format has: application_overview (object), server_overviews
-        if "application_overview" in data and isinstance(data.get("application_overview"), dict):
-            return "drmigrate"
+    # Dr. Migrate format has: application_overview (object), server_overviews
+    if isinstance(data.get("application_overview"), dict):
+        return "drmigrate"
 
     return "unknown"
 
@@ -202,17 +217,65 @@ def convert_drmigrate_to_context(data: dict) -> List[dict]:
         Context file format as list with one dict
     """
     # Import here to avoid circular imports
-    from architecture_scorer.drmigrate_generator import DrMigrateContextGenerator
     from architecture_scorer.drmigrate_schema import DrMigrateApplicationData
 
     # Validate and convert using the generator
     app_data = DrMigrateApplicationData.model_validate(data)
-    generator = DrMigrateContextGenerator()
-    context = generator.generate_context(app_data)
+    context = _get_context_generator().generate_context(app_data)
 
     return context
 
 
+def _get_context_generator():
+    """Get a Dr. Migrate context generator for the current mappings CSV.
+
+    Generators are cached by CSV path and mtime, so edits saved from the
+    modernization editor are picked up on the next upload. If the CSV is
+    missing or unreadable, an uncached generator with the built-in default
+    mappings is returned so a later fix to the file is still seen.
+    """
+    from architecture_scorer.drmigrate_generator import DrMigrateContextGenerator
+    from architecture_scorer.modernization_loader import find_csv_path
+
+    try:
+        csv_path = find_csv_path()
+        if csv_path is not None:
+            return _context_generator_for(
+                str(csv_path.resolve()), csv_path.stat().st_mtime_ns
+            )
+    except Exception:
+        pass
+    return DrMigrateContextGenerator(use_csv_mappings=False)
+
+
+@lru_cache(maxsize=4)
+def _context_generator_for(csv_path: str, mtime_ns: int):
+    """Build a context generator from one version of the mappings CSV."""
+    from pathlib import Path
+
+    from architecture_scorer.drmigrate_generator import DrMigrateContextGenerator
+    from architecture_scorer.modernization_loader import get_compatibility_mappings
+
+    return DrMigrateContextGenerator(
+        compatibility_mappings=get_compatibility_mappings(Path(csv_path))
+    )
+
+
+def _parse_json_bytes(raw: bytes | memoryview) -> Any:
+    """Parse UTF-8 JSON from a bytes-like object, using orjson when installed.
+
+    orjson decodes and parses in one pass. On failure the stdlib re-parses
+    so errors surface as UnicodeDecodeError / json.JSONDecodeError with the
+    usual messages either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(str(raw, 'utf-8'))
+
+
 def get_drmigrate_prompt(app_name: str = "YOUR_APPLICATION_NAME") -> str:
     """Get the LLM prompt for extracting Dr. Migrate data.
 
@@ -222,7 +285,67 @@ def get_drmigrate_prompt(app_name: str = "YOUR_APPLICATION_NAME") -> str:
     Returns:
         Formatted prompt string
     """
-    return DRMIGRATE_LLM_PROMPT.format(app_name=app_name)
+    return _DRMIGRATE_PROMPT_PREFIX + app_name + _DRMIGRATE_PROMPT_SUFFIX
+
+
+def _handle_drmigrate(data: dict) -> Tuple[bool, str, dict | None, List[str]]:
+    """Validate Dr. Migrate data by converting it to context format."""
+    try:
+        context_data = convert_drmigrate_to_context(data)
+        return (True, "", context_data, [])
+    except Exception as e:
+        return (
+            False,
+            f"Error converting Dr. Migrate data: {str(e)}",
+            None,
+            [
+                "Ensure all required fields are present in the Dr. Migrate export",
+                "Check that application_overview contains the application name",
+                "Verify server_overviews is a valid array",
+            ],
+        )
+
+
+def _handle_appcat(data: dict) -> Tuple[bool, str, dict | None, List[str]]:
+    """Validate the structure of an App Cat context file."""
+    # Check required fields
+    missing_fields = []
+
+    if "app_overview" not in data:
+        missing_fields.append("app_overview")
+    elif not data["app_overview"] or not isinstance(data["app_overview"], list):
+        return (
+            False,
+            "app_overview must be a non-empty array",
+            None,
+            MISSING_FIELD_SUGGESTIONS,
+        )
+    elif "application" not in data["app_overview"][0]:
+        missing_fields.append("app_overview[0].application (application name)")
+
+    if "detected_technology_running" not in data:
+        missing_fields.append("detected_technology_running")
+
+    if "server_details" not in data:
+        missing_fields.append("server_details")
+
+    if missing_fields:
+        return (
+            False,
+            f"Missing required field(s): {', '.join(missing_fields)}",
+            None,
+            MISSING_FIELD_SUGGESTIONS,
+        )
+
+    # Wrap back in array for compatibility with scorer
+    return (True, "", [data], [])
+
+
+# Per-format validation, keyed by detect_file_format() result
+_FORMAT_HANDLERS = {
+    "drmigrate": _handle_drmigrate,
+    "appcat": _handle_appcat,
+}
 
 
 def validate_uploaded_file(uploaded_file) -> Tuple[bool, str, dict | None, List[str]]:
@@ -248,8 +371,9 @@ def validate_uploaded_file(uploaded_file) -> Tuple[bool, str, dict | None, List[
 
     # Try to parse JSON
     try:
-        content = uploaded_file.getvalue().decode('utf-8')
-        data = json.loads(content)
+        # getbuffer() is a zero-copy view; release it before returning
+        with uploaded_file.getbuffer() as buf:
+            data = _parse_json_bytes(buf)
     except UnicodeDecodeError:
         return (
             False,
@@ -292,59 +416,10 @@ def validate_uploaded_file(uploaded_file) -> Tuple[bool, str, dict | None, List[
             STRUCTURE_SUGGESTIONS,
         )
 
-    # Detect format
-    file_format = detect_file_format(data)
-
-    # Handle Dr. Migrate format - auto-convert
-    if file_format == "drmigrate":
-        try:
-            context_data = convert_drmigrate_to_context(data)
-            return (True, "", context_data, [])
-        except Exception as e:
-            return (
-                False,
-                f"Error converting Dr. Migrate data: {str(e)}",
-                None,
-                [
-                    "Ensure all required fields are present in the Dr. Migrate export",
-                    "Check that application_overview contains the application name",
-                    "Verify server_overviews is a valid array",
-                ],
-            )
-
-    # Handle App Cat format - validate structure
-    if file_format == "appcat":
-        # Check required fields
-        missing_fields = []
-
-        if "app_overview" not in data:
-            missing_fields.append("app_overview")
-        elif not data["app_overview"] or not isinstance(data["app_overview"], list):
-            return (
-                False,
-                "app_overview must be a non-empty array",
-                None,
-                MISSING_FIELD_SUGGESTIONS,
-            )
-        elif "application" not in data["app_overview"][0]:
-            missing_fields.append("app_overview[0].application (application name)")
-
-        if "detected_technology_running" not in data:
-            missing_fields.append("detected_technology_running")
-
-        if "server_details" not in data:
-            missing_fields.append("server_details")
-
-        if missing_fields:
-            return (
-                False,
-                f"Missing required field(s): {', '.join(missing_fields)}",
-                None,
-                MISSING_FIELD_SUGGESTIONS,
-            )
-
-        # Wrap back in array for compatibility with scorer
-        return (True, "", [data], [])
+    # Dispatch on the detected format
+    handler = _FORMAT_HANDLERS.get(detect_file_format(data))
+    if handler is not None:
+        return handler(data)
 
     # Unknown format - provide helpful guidance
     return (
@@ -381,9 +456,10 @@ def get_format_help_suggestions(data: dict) -> List[str]:
 
 def get_application_name(data: List[dict]) -> str:
     """Extract application name from validated context data."""
-    if data and data[0].get("app_overview"):
+    try:
         return data[0]["app_overview"][0].get("application", "Unknown Application")
-    return "Unknown Application"
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return "Unknown Application"
 
 
 def format_validation_error_with_prompt(
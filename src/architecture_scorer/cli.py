@@ -6,8 +6,9 @@ the architecture catalog.
 
 import json
 import sys
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 from rich.console import Console
@@ -29,9 +30,52 @@ from .drmigrate_schema import (
     DrMigrateApplicationCostComparison,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 console = Console()
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for; shared by both serializers."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dumps_context_json(data: Any, pretty: bool) -> str:
+    """Serialize generated context data to JSON, using orjson when installed.
+
+    The stdlib fallback is configured to give the same output: non-ASCII
+    left unescaped, compact separators (or a 2-space indent when pretty),
+    and datetimes/dataclasses/other values passed through _json_default.
+    One difference remains: orjson writes NaN and Infinity as ``null``,
+    while the stdlib writes the non-standard ``NaN``/``Infinity`` tokens.
+    Data orjson can't encode at all (integers wider than 64 bits) falls
+    back to the stdlib.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | (orjson.OPT_INDENT_2 if pretty else 0)
+        )
+        try:
+            return orjson.dumps(data, default=_json_default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        separators=None if pretty else (",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    )
+
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="architecture-scorer")
 def main():
@@ -683,8 +727,7 @@ def generate_context_cmd(
             output_data = context
 
         # Write output
-        indent = 2 if pretty else None
-        json_output = json.dumps(output_data, indent=indent, default=str)
+        json_output = _dumps_context_json(output_data, pretty)
 
         if out:
             with open(out, "w", encoding="utf-8") as f:
@@ -850,8 +893,9 @@ def generate_sample_drmigrate_cmd(out: str, app_name: str):
     }
 
     try:
+        json_output = json.dumps(sample_data, indent=2)
         with open(out, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f, indent=2)
+            f.write(json_output)
 
         console.print(f"[green]✓[/green] Sample Dr. Migrate data saved to: {out}")
         console.print("\nThis file demonstrates the expected input format for the generate-context command.")
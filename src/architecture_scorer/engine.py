@@ -5,15 +5,18 @@ This is the primary entry point for scoring applications against the catalog.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic import ValidationError
+
 from catalog_builder.schema import ArchitectureCatalog, ArchitectureEntry
 
 from .eligibility_filter import EligibilityFilter
 from .explainer import build_scoring_result
 from .intent_deriver import IntentDeriver
-from .normalizer import ContextNormalizer, load_context_file
+from .normalizer import ContextNormalizer, load_context_file, read_json_file
 from .question_generator import QuestionGenerator
 from .schema import (
     ApplicationContext,
@@ -24,6 +27,62 @@ from .schema import (
 from .scorer import ArchitectureScorer, ScoringWeights
 
 
+@lru_cache(maxsize=32)
+def _parse_version(version: str) -> tuple[int, int]:
+    """Parse the (major, minor) part of a catalog version string.
+
+    Raises:
+        ValueError: If the version isn't in major.minor[.patch] form
+        AttributeError: If the version isn't a string
+    """
+    major, minor, *_ = version.split(".")
+    return int(major), int(minor)
+
+
+def _version_compatible(version: str, min_version: str) -> bool:
+    """Check if a catalog version is at least min_version (major.minor)."""
+    try:
+        return _parse_version(version) >= _parse_version(min_version)
+    except (ValueError, AttributeError, TypeError):
+        return False
+
+
+def _check_catalog_version(version: str, min_version: str) -> None:
+    """Raise ValueError if a catalog version is below min_version."""
+    if not _version_compatible(version, min_version):
+        raise ValueError(
+            f"Catalog version {version} is not compatible. "
+            f"Minimum required: {min_version}"
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_catalog_cached(
+    path_str: str, mtime_ns: int, min_version: str
+) -> ArchitectureCatalog:
+    """Read, validate and version-check a catalog file.
+
+    Cached by resolved path and mtime so repeated loads of an unchanged
+    catalog skip JSON parsing and Pydantic validation. Errors aren't cached.
+    """
+    path = Path(path_str)
+    try:
+        # pydantic-core parses and validates in one pass, without building
+        # an intermediate dict tree
+        catalog = ArchitectureCatalog.model_validate_json(path.read_bytes())
+    except ValidationError:
+        # Report an unsupported version ahead of schema errors
+        data = read_json_file(path)
+        if isinstance(data, dict):
+            _check_catalog_version(data.get("version", "0.0.0"), min_version)
+        raise
+
+    # The schema defaults a missing version; treat it as unversioned
+    version = catalog.version if "version" in catalog.model_fields_set else "0.0.0"
+    _check_catalog_version(version, min_version)
+    return catalog
+
+
 class ScoringEngine:
     """Main orchestrator for architecture scoring.
 
@@ -66,27 +125,14 @@ class ScoringEngine:
         if not path.exists():
             raise FileNotFoundError(f"Catalog not found: {catalog_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Validate version
-        version = data.get("version", "0.0.0")
-        if not self._version_compatible(version):
-            raise ValueError(
-                f"Catalog version {version} is not compatible. "
-                f"Minimum required: {self.MIN_CATALOG_VERSION}"
-            )
-
-        self.catalog = ArchitectureCatalog.model_validate(data)
+        # Parsed catalogs are shared between engines until the file changes
+        self.catalog = _load_catalog_cached(
+            str(path.resolve()), path.stat().st_mtime_ns, self.MIN_CATALOG_VERSION
+        )
 
     def _version_compatible(self, version: str) -> bool:
         """Check if catalog version is compatible."""
-        try:
-            major, minor, *_ = version.split(".")
-            min_major, min_minor, *_ = self.MIN_CATALOG_VERSION.split(".")
-            return (int(major), int(minor)) >= (int(min_major), int(min_minor))
-        except (ValueError, AttributeError):
-            return False
+        return _version_compatible(version, self.MIN_CATALOG_VERSION)
 
     def score(
         self,
@@ -267,8 +313,7 @@ def validate_catalog(catalog_path: str) -> tuple[bool, list[str]]:
         return False, ["Catalog file not found"]
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(path)
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {e}"]
 
@@ -284,11 +329,11 @@ def validate_catalog(catalog_path: str) -> tuple[bool, list[str]]:
 
     # Check version
     version = data.get("version", "0.0.0")
+    min_version = ScoringEngine.MIN_CATALOG_VERSION
     try:
-        major, minor, *_ = version.split(".")
-        if int(major) < 1:
-            issues.append(f"Catalog version {version} is below minimum 1.0")
-    except ValueError:
+        if _parse_version(version) < _parse_version(min_version):
+            issues.append(f"Catalog version {version} is below minimum {min_version}")
+    except (ValueError, AttributeError, TypeError):
         issues.append(f"Invalid version format: {version}")
 
     return len(issues) == 0, issues
@@ -310,8 +355,7 @@ def validate_context(context_path: str) -> tuple[bool, list[str]]:
         return False, ["Context file not found"]
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(path)
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {e}"]
 
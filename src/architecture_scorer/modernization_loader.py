@@ -19,6 +19,26 @@ FULL_CSV_FILENAME = "Modernisation_Options.csv"
 # Default to filtered CSV for better performance and relevance
 DEFAULT_CSV_FILENAME = FILTERED_CSV_FILENAME
 
+# CSV columns, in the order they are written and passed to _parse_row
+CSV_FIELDNAMES = (
+    "ServerSubCategory",
+    "FriendlyName",
+    "modernisation_candidate",
+    "modernisation_treatment",
+    "default_flag",
+    "modernisation_strategy",
+    "modernisation_complexity",
+    "applicable_treatment",
+    "complexity_score",
+    "migration_goal_category",
+    "combo_flag",
+    "light_modernisation_id",
+    "modernisation_focused_id",
+    "key_benefits",
+    "modernisation_candidate_description",
+    "modernisation_candidate_logo",
+)
+
 
 def find_csv_path(use_full: bool = False) -> Optional[Path]:
     """Find the Modernisation_Options CSV file.
@@ -95,12 +115,24 @@ def load_modernization_config(
 
     options: list[ModernizationOption] = []
 
-    with open(csv_path, encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-
-        for row_num, row in enumerate(reader, start=2):
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        # Read positional rows and resolve each known column's index once,
+        # rather than building a dict per row as csv.DictReader does
+        reader = csv.reader(f)
+        header = next(reader, [])
+        columns = {name: i for i, name in enumerate(header)}
+        positions = [columns.get(name) for name in CSV_FIELDNAMES]
+
+        for row_num, values in enumerate(reader, start=2):
+            if not values:
+                continue  # Blank line
+            width = len(values)
+            cells = [
+                values[i] if i is not None and i < width else None
+                for i in positions
+            ]
             try:
-                option = _parse_row(row)
+                option = _parse_row(cells)
                 options.append(option)
             except Exception as e:
                 raise ValueError(
@@ -110,64 +142,81 @@ def load_modernization_config(
     return ModernizationConfig(options=options)
 
 
-def _parse_row(row: dict[str, str]) -> ModernizationOption:
+# Cell values read as true for boolean columns
+_TRUTHY = frozenset(("1", "true", "True", "yes", "Yes"))
+
+
+def _parse_int(value: Optional[str], default: int = 0) -> int:
+    """Parse a numeric cell (e.g. "3" or "3.0"), or return default."""
+    if not value or value.isspace():
+        return default
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return default
+
+
+def _parse_optional_int(value: Optional[str]) -> Optional[int]:
+    """Parse a numeric cell, or return None if empty or invalid."""
+    if not value or value.isspace():
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_bool(value: Optional[str]) -> bool:
+    """Parse a boolean flag cell."""
+    return bool(value) and value.strip() in _TRUTHY
+
+
+def _clean_string(value: Optional[str]) -> str:
+    return (value or "").strip()
+
+
+def _clean_optional_string(value: Optional[str]) -> Optional[str]:
+    return (value or "").strip() or None
+
+
+def _parse_row(cells: list[Optional[str]]) -> ModernizationOption:
     """Parse a CSV row into a ModernizationOption.
 
     Args:
-        row: Dictionary from csv.DictReader.
+        cells: Cell values in CSV_FIELDNAMES order; None for missing columns.
 
     Returns:
         ModernizationOption instance.
     """
-    # Handle numeric fields with defaults
-    def parse_int(value: str, default: int = 0) -> int:
-        if not value or value.strip() == "":
-            return default
-        try:
-            return int(float(value))
-        except (ValueError, TypeError):
-            return default
-
-    def parse_bool(value: str) -> bool:
-        if not value:
-            return False
-        return str(value).strip() in ("1", "true", "True", "yes", "Yes")
-
-    def parse_optional_int(value: str) -> Optional[int]:
-        if not value or value.strip() == "":
-            return None
-        try:
-            return int(float(value))
-        except (ValueError, TypeError):
-            return None
-
-    def clean_string(value: Optional[str]) -> str:
-        return (value or "").strip()
-
-    def clean_optional_string(value: Optional[str]) -> Optional[str]:
-        cleaned = (value or "").strip()
-        return cleaned if cleaned else None
+    (
+        server_sub_category, friendly_name, modernisation_candidate,
+        modernisation_treatment, default_flag, modernisation_strategy,
+        modernisation_complexity, applicable_treatment, complexity_score,
+        migration_goal_category, combo_flag, light_modernisation_id,
+        modernisation_focused_id, key_benefits,
+        modernisation_candidate_description, modernisation_candidate_logo,
+    ) = cells
 
     return ModernizationOption(
-        server_sub_category=clean_string(row.get("ServerSubCategory")),
-        friendly_name=clean_string(row.get("FriendlyName")),
-        modernisation_candidate=clean_string(row.get("modernisation_candidate")),
-        modernisation_treatment=clean_string(row.get("modernisation_treatment")),
-        default_flag=parse_bool(row.get("default_flag", "")),
-        modernisation_strategy=clean_string(row.get("modernisation_strategy")),
-        modernisation_complexity=clean_string(row.get("modernisation_complexity")),
-        applicable_treatment=clean_string(row.get("applicable_treatment")),
-        complexity_score=parse_int(row.get("complexity_score", ""), 0),
-        migration_goal_category=clean_optional_string(row.get("migration_goal_category")),
-        combo_flag=parse_bool(row.get("combo_flag", "")),
-        light_modernisation_id=parse_optional_int(row.get("light_modernisation_id", "")),
-        modernisation_focused_id=parse_optional_int(row.get("modernisation_focused_id", "")),
-        key_benefits=clean_optional_string(row.get("key_benefits")),
-        modernisation_candidate_description=clean_optional_string(
-            row.get("modernisation_candidate_description")
+        server_sub_category=_clean_string(server_sub_category),
+        friendly_name=_clean_string(friendly_name),
+        modernisation_candidate=_clean_string(modernisation_candidate),
+        modernisation_treatment=_clean_string(modernisation_treatment),
+        default_flag=_parse_bool(default_flag),
+        modernisation_strategy=_clean_string(modernisation_strategy),
+        modernisation_complexity=_clean_string(modernisation_complexity),
+        applicable_treatment=_clean_string(applicable_treatment),
+        complexity_score=_parse_int(complexity_score, 0),
+        migration_goal_category=_clean_optional_string(migration_goal_category),
+        combo_flag=_parse_bool(combo_flag),
+        light_modernisation_id=_parse_optional_int(light_modernisation_id),
+        modernisation_focused_id=_parse_optional_int(modernisation_focused_id),
+        key_benefits=_clean_optional_string(key_benefits),
+        modernisation_candidate_description=_clean_optional_string(
+            modernisation_candidate_description
         ),
-        modernisation_candidate_logo=clean_optional_string(
-            row.get("modernisation_candidate_logo")
+        modernisation_candidate_logo=_clean_optional_string(
+            modernisation_candidate_logo
         ),
     )
 
@@ -189,70 +238,47 @@ def save_modernization_config(
 
         shutil.copy2(csv_path, backup_path)
 
-    fieldnames = [
-        "ServerSubCategory",
-        "FriendlyName",
-        "modernisation_candidate",
-        "modernisation_treatment",
-        "default_flag",
-        "modernisation_strategy",
-        "modernisation_complexity",
-        "applicable_treatment",
-        "complexity_score",
-        "migration_goal_category",
-        "combo_flag",
-        "light_modernisation_id",
-        "modernisation_focused_id",
-        "key_benefits",
-        "modernisation_candidate_description",
-        "modernisation_candidate_logo",
-    ]
-
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(_option_to_tuple(option) for option in config.options)
 
-        for option in config.options:
-            writer.writerow(_option_to_row(option))
 
-
-def _option_to_row(option: ModernizationOption) -> dict[str, str]:
-    """Convert a ModernizationOption to a CSV row dictionary.
+def _option_to_tuple(option: ModernizationOption) -> tuple[str, ...]:
+    """Convert a ModernizationOption to a CSV row.
 
     Args:
         option: ModernizationOption to convert.
 
     Returns:
-        Dictionary suitable for csv.DictWriter.
+        Cell values in CSV_FIELDNAMES order, suitable for csv.writer.
     """
-    return {
-        "ServerSubCategory": option.server_sub_category,
-        "FriendlyName": option.friendly_name,
-        "modernisation_candidate": option.modernisation_candidate,
-        "modernisation_treatment": option.modernisation_treatment,
-        "default_flag": "1" if option.default_flag else "0",
-        "modernisation_strategy": option.modernisation_strategy,
-        "modernisation_complexity": option.modernisation_complexity,
-        "applicable_treatment": option.applicable_treatment,
-        "complexity_score": str(option.complexity_score),
-        "migration_goal_category": option.migration_goal_category or "",
-        "combo_flag": "1" if option.combo_flag else "0",
-        "light_modernisation_id": (
+    return (
+        option.server_sub_category,
+        option.friendly_name,
+        option.modernisation_candidate,
+        option.modernisation_treatment,
+        "1" if option.default_flag else "0",
+        option.modernisation_strategy,
+        option.modernisation_complexity,
+        option.applicable_treatment,
+        str(option.complexity_score),
+        option.migration_goal_category or "",
+        "1" if option.combo_flag else "0",
+        (
             str(option.light_modernisation_id)
             if option.light_modernisation_id is not None
             else ""
         ),
-        "modernisation_focused_id": (
+        (
             str(option.modernisation_focused_id)
             if option.modernisation_focused_id is not None
             else ""
         ),
-        "key_benefits": option.key_benefits or "",
-        "modernisation_candidate_description": (
-            option.modernisation_candidate_description or ""
-        ),
-        "modernisation_candidate_logo": option.modernisation_candidate_logo or "",
-    }
+        option.key_benefits or "",
+        option.modernisation_candidate_description or "",
+        option.modernisation_candidate_logo or "",
+    )
 
 
 def add_option(
@@ -283,15 +309,9 @@ def remove_option(
     Returns:
         New ModernizationConfig with the option removed.
     """
+    removed = set(config.find_option_indices(friendly_name, modernisation_candidate))
     return ModernizationConfig(
-        options=[
-            o
-            for o in config.options
-            if not (
-                o.friendly_name == friendly_name
-                and o.modernisation_candidate == modernisation_candidate
-            )
-        ]
+        options=[o for i, o in enumerate(config.options) if i not in removed]
     )
 
 
@@ -312,20 +332,8 @@ def update_option(
     Returns:
         New ModernizationConfig with the option updated.
     """
-    new_options = []
-    for o in config.options:
-        if (
-            o.friendly_name == friendly_name
-            and o.modernisation_candidate == modernisation_candidate
-        ):
-            # Create updated option
-            data = o.model_dump()
-            data.update(updates)
-            new_options.append(ModernizationOption(**data))
-        else:
-            new_options.append(o)
-
-    return ModernizationConfig(options=new_options)
+    new_config = config.model_copy(update={"options": list(config.options)})
+    return new_config.mutate_option(friendly_name, modernisation_candidate, **updates)
 
 
 def set_default_option(
@@ -344,21 +352,15 @@ def set_default_option(
     Returns:
         New ModernizationConfig with updated default flags.
     """
-    new_options = []
-    for o in config.options:
-        if o.friendly_name == friendly_name:
-            # Update default flag based on whether this is the target
-            is_default = o.modernisation_candidate == modernisation_candidate
-            if o.default_flag != is_default:
-                data = o.model_dump()
-                data["default_flag"] = is_default
-                new_options.append(ModernizationOption(**data))
-            else:
-                new_options.append(o)
-        else:
-            new_options.append(o)
-
-    return ModernizationConfig(options=new_options)
+    new_config = config.model_copy(update={"options": list(config.options)})
+    options = new_config.options
+    for i in new_config.find_option_indices(friendly_name):
+        o = options[i]
+        is_default = o.modernisation_candidate == modernisation_candidate
+        if o.default_flag != is_default:
+            options[i] = o.model_copy(update={"default_flag": is_default})
+
+    return new_config
 
 
 def get_compatibility_mappings(
@@ -7,7 +7,7 @@ modernization mappings, loaded from Modernisation_Options.csv.
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ModernizationStrategy(str, Enum):
@@ -134,12 +134,56 @@ class ModernizationConfig(BaseModel):
     """Complete modernization configuration.
 
     Contains all technology-to-Azure mappings loaded from CSV.
+
+    Lookups by technology go through an index of option positions that is
+    built on first use, so replace ``options`` via the modernization_loader
+    helpers rather than editing the list directly.
     """
 
     options: list[ModernizationOption] = Field(
         default_factory=list, description="All modernization options"
     )
 
+    _by_key: Optional[dict[tuple[str, str], tuple[int, ...]]] = PrivateAttr(default=None)
+    _by_friendly: Optional[dict[str, tuple[int, ...]]] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # The lookup index is a cache, so configs compare equal on their
+        # options alone, whether or not either index has been built
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.options == other.options
+
+    def _build_index(self) -> None:
+        by_key: dict[tuple[str, str], list[int]] = {}
+        by_friendly: dict[str, list[int]] = {}
+        for i, opt in enumerate(self.options):
+            key = (opt.friendly_name, opt.modernisation_candidate)
+            by_key.setdefault(key, []).append(i)
+            by_friendly.setdefault(opt.friendly_name, []).append(i)
+        # Tuples, so callers can't modify the index through a lookup result
+        self._by_key = {key: tuple(v) for key, v in by_key.items()}
+        self._by_friendly = {name: tuple(v) for name, v in by_friendly.items()}
+
+    def find_option_indices(
+        self, friendly_name: str, modernisation_candidate: Optional[str] = None
+    ) -> tuple[int, ...]:
+        """Get positions in ``options`` for a technology.
+
+        Args:
+            friendly_name: Technology name.
+            modernisation_candidate: If given, only positions for this Azure
+                target are returned.
+
+        Returns:
+            Indices into ``options``, in ascending order.
+        """
+        if self._by_key is None or self._by_friendly is None:
+            self._build_index()
+        if modernisation_candidate is None:
+            return self._by_friendly.get(friendly_name, ())
+        return self._by_key.get((friendly_name, modernisation_candidate), ())
+
     @property
     def technology_count(self) -> int:
         """Number of unique technologies."""
@@ -162,11 +206,36 @@ class ModernizationConfig(BaseModel):
         """Get sorted list of unique strategies."""
         return sorted(set(o.modernisation_strategy for o in self.options))
 
+    def mutate_option(
+        self, friendly_name: str, modernisation_candidate: str, /, **updates
+    ) -> "ModernizationConfig":
+        """Update an option in place.
+
+        Each matching option is replaced by a validated copy with the
+        updates applied; the rest of ``options`` is left untouched.
+
+        Args:
+            friendly_name: Technology name.
+            modernisation_candidate: Azure target to update.
+            **updates: Field values to change.
+
+        Returns:
+            This configuration, for chaining.
+        """
+        for i in self.find_option_indices(friendly_name, modernisation_candidate):
+            data = self.options[i].model_dump()
+            data.update(updates)
+            self.options[i] = ModernizationOption(**data)
+        if "friendly_name" in updates or "modernisation_candidate" in updates:
+            self._by_key = None
+            self._by_friendly = None
+        return self
+
     def get_options_for_technology(
         self, friendly_name: str
     ) -> list[ModernizationOption]:
         """Get all options for a specific technology."""
-        return [o for o in self.options if o.friendly_name == friendly_name]
+        return [self.options[i] for i in self.find_option_indices(friendly_name)]
 
     def get_technology_groups(self) -> list[TechnologyGroup]:
         """Group options by technology name."""
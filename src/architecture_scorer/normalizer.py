@@ -4,8 +4,10 @@ Normalizes raw application context files into structured, typed objects.
 Handles the messy reality of real-world data.
 """
 
+import json
 import re
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
 from .schema import (
     ApplicationContext,
@@ -26,6 +28,11 @@ from .schema import (
     VMReadiness,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 class ContextNormalizer:
     """Normalizes raw context files into structured ApplicationContext."""
@@ -374,6 +381,21 @@ class ContextNormalizer:
         return ApprovedServices(mappings=all_mappings)
 
 
+def read_json_file(path: Path) -> Any:
+    """Read and parse a UTF-8 JSON file, using orjson when installed.
+
+    On failure the stdlib re-parses so errors surface as
+    json.JSONDecodeError with the usual messages either way.
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
 def load_context_file(file_path: str) -> ApplicationContext:
     """Load and normalize a context file from disk.
 
@@ -386,15 +408,11 @@ def load_context_file(file_path: str) -> ApplicationContext:
     Raises:
         ValueError: If the file is invalid or cannot be parsed.
     """
-    import json
-    from pathlib import Path
-
     path = Path(file_path)
     if not path.exists():
         raise ValueError(f"Context file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json_file(path)
 
     # Handle array wrapper (file is JSON array with one object)
     if isinstance(data, list):
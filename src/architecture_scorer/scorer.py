@@ -146,11 +146,14 @@ class ArchitectureScorer:
         Returns:
             Sorted list of recommendations (highest score first)
         """
-        recommendations = []
+        # Context-derived lookups are the same for every architecture
+        relevant_tags = self._infer_relevant_tags(context)
+        team_skills = self._infer_team_skills(context)
 
-        for arch in architectures:
-            recommendation = self._score_architecture(arch, context, intent)
-            recommendations.append(recommendation)
+        recommendations = [
+            self._score_architecture(arch, context, intent, relevant_tags, team_skills)
+            for arch in architectures
+        ]
 
         # Sort by likelihood score descending
         recommendations.sort(key=lambda r: r.likelihood_score, reverse=True)
@@ -162,8 +165,14 @@ class ArchitectureScorer:
         arch: ArchitectureEntry,
         context: ApplicationContext,
         intent: DerivedIntent,
+        relevant_tags: list[str],
+        team_skills: set[str],
     ) -> ArchitectureRecommendation:
-        """Score a single architecture."""
+        """Score a single architecture.
+
+        relevant_tags and team_skills are derived from the context once per
+        score() call rather than once per architecture.
+        """
         dimensions = []
         matched = []
         mismatched = []
@@ -175,7 +184,7 @@ class ArchitectureScorer:
         dimensions.append(self._score_platform_compatibility(arch, context, matched, mismatched, assumptions))
         dimensions.append(self._score_app_mod_recommended(arch, context, matched, mismatched))
         dimensions.append(self._score_service_overlap(arch, context, matched, mismatched))
-        dimensions.append(self._score_browse_tag_overlap(arch, context, matched, mismatched))
+        dimensions.append(self._score_browse_tag_overlap(arch, relevant_tags, matched, mismatched))
         dimensions.append(self._score_availability_alignment(arch, intent, matched, mismatched, assumptions))
         dimensions.append(self._score_operating_model_fit(arch, intent, matched, mismatched, assumptions))
         dimensions.append(self._score_complexity_tolerance(arch, context, intent, matched, mismatched))
@@ -185,7 +194,7 @@ class ArchitectureScorer:
         dimensions.append(self._score_audience_fit(arch, context, intent, matched, mismatched))
         dimensions.append(self._score_maturity_alignment(arch, intent, matched, mismatched))
         dimensions.append(self._score_design_pattern_relevance(arch, context, intent, matched, mismatched))
-        dimensions.append(self._score_prerequisite_match(arch, context, matched, mismatched))
+        dimensions.append(self._score_prerequisite_match(arch, team_skills, matched, mismatched))
 
         # Calculate base score
         total_weighted = sum(d.weighted_score for d in dimensions)
@@ -513,13 +522,11 @@ class ArchitectureScorer:
     def _score_browse_tag_overlap(
         self,
         arch: ArchitectureEntry,
-        context: ApplicationContext,
+        relevant_tags: list[str],
         matched: list[MatchedDimension],
         mismatched: list[MismatchedDimension],
     ) -> ScoringDimension:
         """Score overlap between app characteristics and browse tags."""
-        # Infer relevant tags from context
-        relevant_tags = self._infer_relevant_tags(context)
         arch_tags = [t.lower() for t in arch.browse_tags]
 
         if not relevant_tags:
@@ -574,6 +581,33 @@ class ArchitectureScorer:
 
         return [t.lower() for t in tags]
 
+    def _infer_team_skills(self, context: ApplicationContext) -> set[str]:
+        """Infer team skills (lowercased) from the detected technology stack."""
+        # Build team capabilities from detected technology
+        team_skills: set[str] = set()
+        for tech in context.detected_technology.technologies:
+            team_skills.add(tech.lower())
+
+        # Add framework-based skills
+        for fw in context.detected_technology.frameworks:
+            team_skills.add(fw.lower())
+
+        # Infer skills from primary runtime
+        runtime = (context.detected_technology.primary_runtime or "").lower()
+        if runtime:
+            team_skills.add(runtime)
+            if runtime in ("java", ".net", "dotnet"):
+                team_skills.add("enterprise development")
+            if "spring" in runtime:
+                team_skills.add("spring")
+                team_skills.add("java")
+
+        # Check for container experience
+        if context.detected_technology.containerized:
+            team_skills.update(["docker", "containers", "container"])
+
+        return team_skills
+
     def _score_availability_alignment(
         self,
         arch: ArchitectureEntry,
@@ -1188,7 +1222,7 @@ class ArchitectureScorer:
     def _score_prerequisite_match(
         self,
         arch: ArchitectureEntry,
-        context: ApplicationContext,
+        team_skills: set[str],
         matched: list[MatchedDimension],
         mismatched: list[MismatchedDimension],
     ) -> ScoringDimension:
@@ -1209,29 +1243,6 @@ class ArchitectureScorer:
 
         prerequisites = [p.lower() for p in arch.content_insights.team_prerequisites]
 
-        # Build team capabilities from detected technology
-        team_skills = set()
-        for tech in context.detected_technology.technologies:
-            team_skills.add(tech.lower())
-
-        # Add framework-based skills
-        for fw in context.detected_technology.frameworks:
-            team_skills.add(fw.lower())
-
-        # Infer skills from primary runtime
-        runtime = (context.detected_technology.primary_runtime or "").lower()
-        if runtime:
-            team_skills.add(runtime)
-            if runtime in ("java", ".net", "dotnet"):
-                team_skills.add("enterprise development")
-            if "spring" in runtime:
-                team_skills.add("spring")
-                team_skills.add("java")
-
-        # Check for container experience
-        if context.detected_technology.containerized:
-            team_skills.update(["docker", "containers", "container"])
-
         # Match prerequisites against team skills
         matched_prereqs = []
         unmatched_prereqs = []
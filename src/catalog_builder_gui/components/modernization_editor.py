@@ -464,10 +464,12 @@ def _apply_changes(config: ModernizationConfig, changes: list[dict]) -> Moderniz
     """Apply a list of changes to the configuration."""
     from architecture_scorer.modernization_loader import (
         remove_option,
-        update_option,
         set_default_option,
     )
 
+    # Work on a copy of the option list so updates can be applied in place
+    # without touching the config held in session state
+    config = config.model_copy(update={"options": list(config.options)})
     for change in changes:
         action = change["action"]
         friendly_name = change["friendly_name"]
@@ -478,7 +480,7 @@ def _apply_changes(config: ModernizationConfig, changes: list[dict]) -> Moderniz
         elif action == "delete":
             config = remove_option(config, friendly_name, candidate)
         elif action == "update":
-            config = update_option(config, friendly_name, candidate, change["updates"])
+            config.mutate_option(friendly_name, candidate, **change["updates"])
 
     return config
 
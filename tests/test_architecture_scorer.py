@@ -15,7 +15,7 @@ from typing import Optional
 
 import pytest
 
-from architecture_scorer.engine import ScoringEngine
+from architecture_scorer.engine import ScoringEngine, validate_catalog
 from architecture_scorer.schema import (
     ScoringResult,
     SignalConfidence,
@@ -931,6 +931,43 @@ class TestEdgeCases:
             assert len(result.recommendations) <= max_rec
 
 
+class TestCatalogValidation:
+    """Tests for catalog version checks in validate_catalog and load_catalog."""
+
+    @staticmethod
+    def _write_catalog(tmp_path: Path, version) -> str:
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps({"version": version, "architectures": [{}]}))
+        return str(path)
+
+    @pytest.mark.parametrize("version", ["1.0", "1.0.0", "2.3.1"])
+    def test_supported_versions_pass(self, tmp_path: Path, version: str):
+        is_valid, issues = validate_catalog(self._write_catalog(tmp_path, version))
+        assert is_valid, issues
+
+    def test_old_version_rejected(self, tmp_path: Path):
+        is_valid, issues = validate_catalog(self._write_catalog(tmp_path, "0.9.0"))
+        assert not is_valid
+        assert issues == ["Catalog version 0.9.0 is below minimum 1.0"]
+
+    @pytest.mark.parametrize("version", ["1", "one.two", 1.0])
+    def test_malformed_version_reported(self, tmp_path: Path, version):
+        is_valid, issues = validate_catalog(self._write_catalog(tmp_path, version))
+        assert not is_valid
+        assert issues == [f"Invalid version format: {version}"]
+
+    @pytest.mark.parametrize("catalog", [
+        {"version": "0.9.0", "source_repo": "test"},
+        {"source_repo": "test"},  # Schema default must not hide a missing version
+        {"version": "0.9.0", "architectures": "not-a-list"},
+    ])
+    def test_load_catalog_rejects_unsupported_version(self, tmp_path: Path, catalog: dict):
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(catalog))
+        with pytest.raises(ValueError, match="is not compatible"):
+            ScoringEngine().load_catalog(str(path))
+
+
 class TestScoringConsistency:
     """Tests for scoring consistency and determinism."""
 
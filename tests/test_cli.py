@@ -0,0 +1,60 @@
+"""Tests for architecture_scorer CLI helpers."""
+
+import json
+from datetime import datetime, timezone
+from enum import Enum
+
+import pytest
+
+from architecture_scorer import cli
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+SAMPLE = {
+    "app_overview": [{"application": "Café Süd – 日本", "business_criticality": "High"}],
+    "server_details": [
+        {"machine": "srv-01", "cores": 4, "ram_gb": 15.5, "tags": [], "meta": {}},
+        {"machine": None, "flag": True, "color": _Color.RED},
+    ],
+    "generated_at": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    "by_id": {1: "one"},
+}
+
+
+class TestDumpsContextJson:
+    """The orjson and stdlib serializers must produce the same output."""
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_stdlib_and_orjson_outputs_match(self, monkeypatch, pretty):
+        pytest.importorskip("orjson")
+        with_orjson = cli._dumps_context_json(SAMPLE, pretty)
+        monkeypatch.setattr(cli, "orjson", None)
+        with_stdlib = cli._dumps_context_json(SAMPLE, pretty)
+
+        assert json.loads(with_orjson) == json.loads(with_stdlib)
+        assert with_orjson == with_stdlib
+
+    def test_stdlib_output_shape(self, monkeypatch):
+        monkeypatch.setattr(cli, "orjson", None)
+        data = json.loads(cli._dumps_context_json(SAMPLE, pretty=False))
+
+        assert data["app_overview"][0]["application"] == "Café Süd – 日本"
+        assert data["generated_at"] == "2024-05-01 12:30:00+00:00"
+        assert data["server_details"][1]["color"] == "red"
+        assert data["by_id"] == {"1": "one"}
+
+    def test_nan_written_as_null_by_orjson_only(self, monkeypatch):
+        pytest.importorskip("orjson")
+        data = {"score": float("nan"), "ratio": float("inf")}
+        assert cli._dumps_context_json(data, pretty=False) == '{"score":null,"ratio":null}'
+        monkeypatch.setattr(cli, "orjson", None)
+        assert cli._dumps_context_json(data, pretty=False) == '{"score":NaN,"ratio":Infinity}'
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_integers_wider_than_64_bits(self, pretty):
+        data = {"app_overview": [{"id": 2**64}], "name": "Café"}
+        assert json.loads(cli._dumps_context_json(data, pretty)) == data
+        assert "Café" in cli._dumps_context_json(data, pretty)
@@ -0,0 +1,130 @@
+"""Tests for modernization option lookups and editing helpers."""
+
+import pytest
+from pydantic import ValidationError
+
+from architecture_scorer.modernization_loader import (
+    add_option,
+    remove_option,
+    set_default_option,
+    update_option,
+)
+from architecture_scorer.modernization_schema import (
+    ModernizationConfig,
+    ModernizationOption,
+)
+
+
+def make_option(friendly_name: str, candidate: str, **fields) -> ModernizationOption:
+    data = {
+        "server_sub_category": "Web",
+        "friendly_name": friendly_name,
+        "modernisation_candidate": candidate,
+        "modernisation_treatment": f"{friendly_name}-to-{candidate}",
+        "modernisation_strategy": "PaaS",
+        "modernisation_complexity": "Easy",
+        "applicable_treatment": "Replatform/Refactor",
+    }
+    data.update(fields)
+    return ModernizationOption(**data)
+
+
+@pytest.fixture
+def config() -> ModernizationConfig:
+    return ModernizationConfig(options=[
+        make_option("IIS", "Azure App Service", default_flag=True),
+        make_option("Tomcat", "Azure App Service"),
+        make_option("IIS", "Azure Container Apps"),
+        make_option("Tomcat", "Azure Kubernetes Service", default_flag=True),
+    ])
+
+
+def candidates(options: list[ModernizationOption]) -> list[str]:
+    return [o.modernisation_candidate for o in options]
+
+
+class TestOptionIndex:
+    """Tests for the (friendly_name, candidate) lookup index."""
+
+    def test_find_option_indices(self, config):
+        assert config.find_option_indices("IIS") == (0, 2)
+        assert config.find_option_indices("IIS", "Azure Container Apps") == (2,)
+        assert config.find_option_indices("Unknown") == ()
+        assert config.find_option_indices("IIS", "Unknown") == ()
+
+    def test_lookups_after_remove(self, config):
+        config.get_options_for_technology("IIS")  # Build the index first
+        updated = remove_option(config, "IIS", "Azure App Service")
+
+        assert candidates(updated.get_options_for_technology("IIS")) == ["Azure Container Apps"]
+        assert updated.find_option_indices("Tomcat", "Azure Kubernetes Service") == (2,)
+        # The original config is unchanged
+        assert config.find_option_indices("IIS") == (0, 2)
+
+    def test_lookups_after_add(self, config):
+        config.get_options_for_technology("IIS")
+        updated = add_option(config, make_option("IIS", "Azure Virtual Machines"))
+
+        assert candidates(updated.get_options_for_technology("IIS")) == [
+            "Azure App Service", "Azure Container Apps", "Azure Virtual Machines",
+        ]
+        assert updated.find_option_indices("IIS", "Azure Virtual Machines") == (4,)
+        assert config.find_option_indices("IIS", "Azure Virtual Machines") == ()
+
+    def test_lookups_after_update_renames_candidate(self, config):
+        config.get_options_for_technology("IIS")
+        updated = update_option(
+            config, "IIS", "Azure Container Apps",
+            {"modernisation_candidate": "Azure Kubernetes Service"},
+        )
+
+        assert updated.find_option_indices("IIS", "Azure Container Apps") == ()
+        assert updated.find_option_indices("IIS", "Azure Kubernetes Service") == (2,)
+        assert config.find_option_indices("IIS", "Azure Container Apps") == (2,)
+
+    def test_lookup_results_are_immutable(self, config):
+        indices = config.find_option_indices("IIS")
+        with pytest.raises(AttributeError):
+            indices.append(1)
+        assert config.find_option_indices("IIS") == (0, 2)
+
+    def test_equality_ignores_index(self, config):
+        other = config.model_copy(update={"options": list(config.options)})
+        config.get_options_for_technology("IIS")  # Build only one index
+
+        assert config == other
+        assert config != remove_option(other, "IIS", "Azure App Service")
+
+    def test_set_default_only_touches_one_technology(self, config):
+        updated = set_default_option(config, "IIS", "Azure Container Apps")
+
+        assert [o.default_flag for o in updated.options] == [False, False, True, True]
+        assert [o.default_flag for o in config.options] == [True, False, False, True]
+        assert updated.options[1] is config.options[1]
+
+
+class TestMutateOption:
+    """Tests for in-place ModernizationConfig.mutate_option."""
+
+    def test_updates_in_place(self, config):
+        options = config.options
+        assert config.mutate_option("IIS", "Azure App Service", complexity_score=3) is config
+
+        assert config.options is options
+        assert config.options[0].complexity_score == 3
+        assert config.options[2].complexity_score == 0
+
+    def test_lookups_after_key_field_change(self, config):
+        config.get_options_for_technology("IIS")  # Build the index first
+        config.mutate_option("IIS", "Azure Container Apps", friendly_name="Tomcat")
+
+        assert candidates(config.get_options_for_technology("IIS")) == ["Azure App Service"]
+        assert candidates(config.get_options_for_technology("Tomcat")) == [
+            "Azure App Service", "Azure Container Apps", "Azure Kubernetes Service",
+        ]
+        assert config.find_option_indices("Tomcat", "Azure Container Apps") == (2,)
+
+    def test_revalidates_updates(self, config):
+        with pytest.raises(ValidationError):
+            config.mutate_option("IIS", "Azure App Service", complexity_score=5)
+        assert config.options[0].complexity_score == 0
@@ -0,0 +1,186 @@
+"""Tests for PDF report diagram downloading, caching and layout."""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from architecture_recommendations_app.components import pdf_generator
+
+
+class FakeResponse:
+    """Streaming response stand-in for requests.Session.get()."""
+
+    def __init__(self, chunks: list[bytes], headers: dict | None = None, ok: bool = True):
+        self.chunks = chunks
+        self.headers = headers or {}
+        self.ok = ok
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size: int):
+        yield from self.chunks
+
+
+class FakeSession:
+    def __init__(self, response: FakeResponse):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Make _download_diagram receive the given response."""
+    def _serve(response: FakeResponse) -> None:
+        monkeypatch.setattr(pdf_generator, "_http_session", lambda: FakeSession(response))
+    monkeypatch.setattr(pdf_generator, "MAX_DIAGRAM_BYTES", 10)
+    return _serve
+
+
+class TestDownloadDiagram:
+    """Tests for the MAX_DIAGRAM_BYTES download cap."""
+
+    URL = "https://learn.microsoft.com/diagram.png"
+
+    def test_returns_content_within_limit(self, serve):
+        serve(FakeResponse([b"12345", b"67890"], {"Content-Length": "10"}))
+        assert pdf_generator._download_diagram(self.URL) == b"1234567890"
+
+    def test_rejects_declared_oversized_response(self, serve):
+        serve(FakeResponse([b"1"], {"Content-Length": "11"}))
+        assert pdf_generator._download_diagram(self.URL) is None
+
+    def test_rejects_oversized_body_without_content_length(self, serve):
+        serve(FakeResponse([b"123456", b"789012"]))
+        assert pdf_generator._download_diagram(self.URL) is None
+
+    def test_rejects_body_larger_than_declared(self, serve):
+        serve(FakeResponse([b"123456", b"789012"], {"Content-Length": "5"}))
+        assert pdf_generator._download_diagram(self.URL) is None
+
+    def test_rejects_error_status(self, serve):
+        serve(FakeResponse([b"123"], ok=False))
+        assert pdf_generator._download_diagram(self.URL) is None
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "diagrams"
+    monkeypatch.setattr(pdf_generator, "DIAGRAM_CACHE_DIR", path)
+    return path
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership checks only")
+class TestDiagramCacheDir:
+    """Tests for the owner/permission checks on the cache directory."""
+
+    def test_creates_owner_only_directory(self, cache_dir):
+        assert pdf_generator._diagram_cache_dir() == cache_dir
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_refuses_group_or_world_accessible_directory(self, cache_dir):
+        cache_dir.mkdir(mode=0o700)
+        cache_dir.chmod(0o755)
+        assert pdf_generator._diagram_cache_dir() is None
+
+    def test_refuses_directory_owned_by_another_user(self, cache_dir, monkeypatch):
+        cache_dir.mkdir(mode=0o700)
+        monkeypatch.setattr(os, "getuid", lambda: cache_dir.stat().st_uid + 1)
+        assert pdf_generator._diagram_cache_dir() is None
+
+
+class TestDiagramCacheEviction:
+    """Tests for least-recently-used eviction of cached diagrams."""
+
+    def test_round_trip_uses_hashed_file_name(self, cache_dir):
+        cache_dir.mkdir()
+        url = "https://learn.microsoft.com/a.png"
+        pdf_generator._write_cached_diagram(cache_dir, url, b"png")
+
+        assert [p.name for p in cache_dir.iterdir()] == [pdf_generator._diagram_cache_key(url)]
+        assert pdf_generator._read_cached_diagram(cache_dir, url) == b"png"
+
+    def test_evicts_least_recently_used(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(pdf_generator, "DIAGRAM_CACHE_MAX_FILES", 3)
+        cache_dir.mkdir()
+        urls = [f"https://learn.microsoft.com/{i}.png" for i in range(5)]
+        now = time.time()
+        for age, url in zip(range(5, 0, -1), urls):
+            pdf_generator._write_cached_diagram(cache_dir, url, url.encode())
+            path = cache_dir / pdf_generator._diagram_cache_key(url)
+            os.utime(path, (now - age * 60, now - age * 60))
+        # Reading the oldest entry marks it as recently used
+        assert pdf_generator._read_cached_diagram(cache_dir, urls[0]) is not None
+        # In-progress temp files are neither counted nor removed
+        (cache_dir / ".tmp_partial").write_bytes(b"")
+
+        pdf_generator._evict_cached_diagrams(cache_dir)
+
+        kept = [url for url in urls if (cache_dir / pdf_generator._diagram_cache_key(url)).exists()]
+        assert kept == [urls[0], urls[3], urls[4]]
+        assert (cache_dir / ".tmp_partial").exists()
+
+    def test_no_eviction_at_limit(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(pdf_generator, "DIAGRAM_CACHE_MAX_FILES", 2)
+        cache_dir.mkdir()
+        for i in range(2):
+            pdf_generator._write_cached_diagram(cache_dir, f"https://x/{i}", b"x")
+
+        pdf_generator._evict_cached_diagrams(cache_dir)
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+
+
+class TestPatternLine:
+    """Only the quality label on the pattern line takes the quality colour."""
+
+    def _pattern_line(self, pattern_name: str, quality: str):
+        from types import SimpleNamespace
+        from architecture_scorer.schema import CatalogQuality
+
+        rec = SimpleNamespace(
+            catalog_quality=CatalogQuality(quality), pattern_name=pattern_name,
+            name="Web App", likelihood_score=80.0, description="", core_services=[],
+            fit_summary=[], struggle_summary=[], learn_url=None, diagram_url=None,
+        )
+        styles = pdf_generator._get_custom_styles()
+        for element in pdf_generator._build_recommendation_section(rec, 1, styles):
+            if isinstance(element, pdf_generator.Table):
+                first = element._cellvalues[0][0]
+                if getattr(first, "text", "").startswith("Pattern:"):
+                    return element
+        raise AssertionError("pattern line not found")
+
+    @pytest.mark.parametrize("quality,style", [
+        ("curated", "QualityCurated"),
+        ("ai_enriched", "QualityEnriched"),
+        ("example_only", "QualityOther"),
+    ])
+    def test_label_styled_separately(self, quality, style):
+        pattern, label = self._pattern_line("Baseline Web App", quality)._cellvalues[0]
+
+        assert pattern.text == "Pattern: Baseline Web App | Quality:"
+        assert pattern.style.name == "MetaText"
+        assert label.style.name == style
+
+    def test_short_pattern_name_stays_on_one_line(self):
+        line = self._pattern_line("Baseline Web App", "curated")
+        leading = line._cellvalues[0][0].style.leading
+        _, height = line.wrap(pdf_generator._PATTERN_LINE_WIDTH, 1000)
+        assert height == leading
+
+    def test_long_pattern_name_wraps_within_line_width(self):
+        line = self._pattern_line("Mission Critical " * 20, "curated")
+        leading = line._cellvalues[0][0].style.leading
+        width, height = line.wrap(pdf_generator._PATTERN_LINE_WIDTH, 1000)
+        assert width <= pdf_generator._PATTERN_LINE_WIDTH
+        assert height > leading
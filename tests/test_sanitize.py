@@ -145,6 +145,54 @@ class TestValidateUrl:
         is_valid, error = validate_url(url, allow_http=True)
         assert is_valid is False
 
+    def test_private_range_boundaries(self):
+        """Test that blocked ranges end exactly at their broadcast address."""
+        is_valid, error = validate_url("http://172.31.255.255/", allow_http=True)
+        assert is_valid is False
+        assert "private/internal" in error
+        is_valid, error = validate_url("http://172.32.0.0/", allow_http=True)
+        assert is_valid is False
+        assert "not in the allowed list" in error
+
+    def test_blocks_short_form_loopback(self):
+        """Test that resolver shorthand like 127.1 is treated as loopback."""
+        is_valid, error = validate_url("http://127.1/", allow_http=True)
+        assert is_valid is False
+        assert "private/internal" in error
+
+    def test_checks_host_after_userinfo(self):
+        """Test that userinfo can't smuggle an allowed domain past the check."""
+        url = "https://docs.microsoft.com:x@evil.com/"
+        is_valid, error = validate_url(url)
+        assert is_valid is False
+        assert "evil.com" in error
+
+    def test_blocks_bracketed_ipv6_loopback(self):
+        """Test that [::1] is recognised as a blocked IP."""
+        is_valid, error = validate_url("https://[::1]:8080/")
+        assert is_valid is False
+        assert "private/internal" in error
+
+    def test_rejects_unicode_lookalike_domain(self):
+        """Test that non-ASCII case-folding lookalikes aren't allowlisted."""
+        # U+017F (long s) case-folds to 's'
+        is_valid, error = validate_url("https://docs.microſoft.com/a.png")
+        assert is_valid is False
+
+    def test_accepts_leading_whitespace_like_urlparse(self):
+        """Test that leading spaces/controls and embedded tabs don't fail the scheme check."""
+        for url in (" https://docs.microsoft.com/", "\thttps://docs.microsoft.com/",
+                    "ht\ttps://docs.microsoft.com/"):
+            assert validate_url(url) == (True, "")
+        is_valid, error = validate_url(" ftp://docs.microsoft.com/")
+        assert is_valid is False
+        assert "scheme" in error
+
+    def test_rejects_non_string_input(self):
+        """Test that unhashable non-str input is rejected rather than raising."""
+        for url in (None, 42, ["https://docs.microsoft.com/"], {"a": 1}):
+            assert validate_url(url) == (False, "Invalid URL format")
+
     def test_blocks_unknown_domain(self):
         """Test that unknown domains are blocked."""
         url = "https://evil.com/malware.exe"
@@ -152,6 +200,12 @@ class TestValidateUrl:
         assert is_valid is False
         assert "not in the allowed list" in error.lower()
 
+    def test_custom_allowlist_matches_any_parent_domain(self):
+        """Test that multi-label allowed domains also admit their subdomains."""
+        allowed = frozenset(["assets.example.com"])
+        assert validate_url("https://cdn.assets.example.com/a.png", allowed)[0] is True
+        assert validate_url("https://example.com/a.png", allowed)[0] is False
+
     def test_blocks_file_protocol(self):
         """Test that file:// protocol is blocked."""
         url = "file:///etc/passwd"
@@ -0,0 +1,148 @@
+"""Tests for uploaded context file validation."""
+
+import json
+import math
+import os
+import shutil
+
+import pytest
+
+from architecture_recommendations_app.utils import validation
+from architecture_scorer.drmigrate_generator import DEFAULT_COMPATIBILITY_MAPPINGS
+from architecture_scorer.modernization_loader import find_csv_path
+
+
+APPCAT_CONTEXT = {
+    "app_overview": [{"application": "Test App"}],
+    "detected_technology_running": [],
+    "server_details": [],
+}
+
+
+class FakeUpload:
+    """Minimal stand-in for a Streamlit UploadedFile."""
+
+    def __init__(self, data: bytes, content_type: str = "application/json"):
+        self._data = data
+        self.size = len(data)
+        self.type = content_type
+
+    def getvalue(self) -> bytes:
+        return self._data
+
+    def getbuffer(self) -> memoryview:
+        return memoryview(self._data)
+
+
+def upload_json(obj, content_type: str = "application/json") -> FakeUpload:
+    return FakeUpload(json.dumps(obj).encode("utf-8"), content_type)
+
+
+class TestContextGeneratorCache:
+    """Tests for reuse of the Dr. Migrate context generator."""
+
+    @pytest.fixture
+    def mappings_csv(self, tmp_path, monkeypatch):
+        source = find_csv_path()
+        if source is None:
+            pytest.skip("Modernisation_Options CSV not found")
+        csv_path = tmp_path / "options.csv"
+        shutil.copy(source, csv_path)
+        monkeypatch.setenv("MODERNIZATION_OPTIONS_CSV", str(csv_path))
+        validation._context_generator_for.cache_clear()
+        yield csv_path
+        validation._context_generator_for.cache_clear()
+
+    def test_reused_while_csv_unchanged(self, mappings_csv):
+        assert validation._get_context_generator() is validation._get_context_generator()
+
+    def test_rebuilt_after_csv_is_saved(self, mappings_csv):
+        first = validation._get_context_generator()
+        stat = mappings_csv.stat()
+        os.utime(mappings_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert validation._get_context_generator() is not first
+
+    def test_fallback_not_cached(self, tmp_path, monkeypatch):
+        missing = tmp_path / "missing.csv"
+        monkeypatch.setattr(
+            "architecture_scorer.modernization_loader.find_csv_path", lambda: missing
+        )
+        first = validation._get_context_generator()
+        assert first.compatibility_mappings is DEFAULT_COMPATIBILITY_MAPPINGS
+        assert validation._get_context_generator() is not first
+
+
+class TestValidateUploadedFile:
+    """Tests for validate_uploaded_file."""
+
+    @pytest.mark.parametrize("content_type", [
+        "application/json", "application/x-json", "text/x-json", "", None,
+    ])
+    def test_content_type_does_not_gate_parsing(self, content_type):
+        is_valid, error, data, _ = validation.validate_uploaded_file(
+            upload_json([APPCAT_CONTEXT], content_type)
+        )
+        assert is_valid, error
+        assert data == [APPCAT_CONTEXT]
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def json_backend(self, request, monkeypatch):
+        """Run a test with orjson parsing (if installed) and with the stdlib."""
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(validation, "orjson", None)
+        return request.param
+
+    def test_appcat_dispatch(self, json_backend):
+        is_valid, error, data, _ = validation.validate_uploaded_file(upload_json(APPCAT_CONTEXT))
+        assert is_valid, error
+        assert data == [APPCAT_CONTEXT]
+
+    def test_appcat_missing_fields(self, json_backend):
+        context = {"app_overview": [{"application": "Test App"}], "server_details": []}
+        is_valid, error, data, suggestions = validation.validate_uploaded_file(upload_json(context))
+        assert not is_valid
+        assert error == "Missing required field(s): detected_technology_running"
+        assert suggestions == validation.MISSING_FIELD_SUGGESTIONS
+
+    def test_drmigrate_dispatch(self, json_backend):
+        export = {"application_overview": {"application": "Dr Migrate App"}}
+        is_valid, error, data, _ = validation.validate_uploaded_file(upload_json(export))
+        assert is_valid, error
+        assert data[0]["app_overview"][0]["application"] == "Dr Migrate App"
+
+    def test_unknown_format(self, json_backend):
+        is_valid, error, data, _ = validation.validate_uploaded_file(upload_json({"foo": 1}))
+        assert not is_valid
+        assert error.startswith("Unrecognized file format")
+        assert data is None
+
+    def test_invalid_json(self, json_backend):
+        is_valid, error, data, suggestions = validation.validate_uploaded_file(
+            FakeUpload(b'[{"app_overview": ')
+        )
+        assert not is_valid
+        assert error.startswith("Invalid JSON format: Expecting value at line 1")
+        assert suggestions == validation.FILE_FORMAT_SUGGESTIONS
+
+    def test_non_utf8_bytes(self, json_backend):
+        raw = json.dumps([APPCAT_CONTEXT]).replace("Test App", "Café").encode("latin-1")
+        is_valid, error, data, _ = validation.validate_uploaded_file(FakeUpload(raw))
+        assert not is_valid
+        assert error == "File encoding error. Please ensure the file is UTF-8 encoded."
+
+    def test_nan_accepted_by_both_backends(self, json_backend):
+        # orjson rejects NaN; the stdlib fallback accepts it, as before orjson
+        raw = json.dumps([{**APPCAT_CONTEXT, "score": float("nan")}]).encode("utf-8")
+        assert b"NaN" in raw
+        is_valid, error, data, _ = validation.validate_uploaded_file(FakeUpload(raw))
+        assert is_valid, error
+        assert math.isnan(data[0]["score"])
+
+    def test_too_large(self):
+        upload = FakeUpload(b"[]")
+        upload.size = validation.MAX_FILE_SIZE + 1
+        is_valid, error, _, _ = validation.validate_uploaded_file(upload)
+        assert not is_valid
+        assert error.startswith("File too large")